@@ -0,0 +1,17 @@
+"""Image derivative rendering for the process pool in server.py.
+
+Spawned workers import this module instead of server.py, so it must stay free
+of side effects: no settings, database clients or directories at import time.
+"""
+import os
+from PIL import Image, ImageOps
+
+def render_derivative(source: str, target: str, max_size: int):
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((max_size, max_size))
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.mode in ("LA", "PA") or "transparency" in image.info else "RGB")
+        temp_target = f"{target}.{os.getpid()}.part"
+        image.save(temp_target, "WEBP", quality=80, method=4)
+    os.replace(temp_target, target)
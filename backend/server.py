@@ -1,34 +1,277 @@
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, status, UploadFile, File, Query, Response, Request, BackgroundTasks
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.staticfiles import StaticFiles
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.routing import Match
+from image_derivatives import render_derivative
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter, BeforeValidator, PlainSerializer
+from typing import List, Optional, Literal, Annotated, Union
+from functools import lru_cache
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, date, timezone, timedelta
 from passlib.context import CryptContext
 import jwt
 from dateutil.relativedelta import relativedelta
 import csv
+import codecs
 import io
-import shutil
+import hashlib
+import json
+import orjson
+import base64
+import re
+import time
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+import contextvars
+from bisect import bisect_left
+from pymongo import UpdateOne, ReturnDocument, monitoring
+from pymongo.errors import OperationFailure, BulkWriteError, ConnectionFailure, ServerSelectionTimeoutError
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Metrics, exposed in Prometheus text format on /api/metrics
+METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+request_latency = {}  # (method, route) -> histogram
+request_counts = {}  # (method, route, status) -> count
+requests_in_flight = {}  # (method, route) -> count
+mongo_latency = {}  # (collection, command) -> histogram
+mongo_failures = {}  # (collection, command) -> count
+mongo_metrics_lock = threading.Lock()  # Command events arrive on pymongo's threads
+
+def observe(histograms: dict, key: tuple, seconds: float):
+    histogram = histograms.get(key)
+    if histogram is None:
+        # One slot per bucket plus +Inf, made cumulative when rendered
+        histogram = histograms[key] = {"buckets": [0] * (len(METRICS_BUCKETS) + 1), "sum": 0.0, "count": 0}
+    histogram["buckets"][bisect_left(METRICS_BUCKETS, seconds)] += 1
+    histogram["sum"] += seconds
+    histogram["count"] += 1
+
+# Slow MongoDB operations, grouped by query shape and explained once per shape
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", "100"))
+SLOW_QUERY_MAX_SHAPES = 500
+SLOW_QUERY_COMMANDS = {"find", "aggregate", "count", "distinct", "findAndModify", "update", "delete"}
+SLOW_QUERY_IGNORED_KEYS = {"$db", "lsid", "txnNumber", "autocommit", "$clusterTime", "$readPreference", "readConcern", "writeConcern"}
+slow_queries = {}  # shape key -> report entry
+slow_query_state = {"loop": None}
+current_route = contextvars.ContextVar("current_route", default="")
+
+def query_shape(value):
+    # Values are masked so one entry covers every call of the same query and no customer data is kept
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if all(not isinstance(item, (dict, list)) for item in value):
+            return ["?"]
+        return [query_shape(item) for item in value]
+    return "?"
+
+def command_filter(command_name: str, command: dict):
+    if command_name == "find":
+        return {"filter": query_shape(command.get("filter", {})), "sort": command.get("sort")}
+    if command_name == "aggregate":
+        return query_shape(command.get("pipeline", []))
+    if command_name in ("update", "delete"):
+        statements = command.get("updates" if command_name == "update" else "deletes") or [{}]
+        return query_shape(statements[0].get("q", {}))
+    return query_shape(command.get("query", {}))
+
+def plan_summary(explain: dict) -> dict:
+    stages = []
+    indexes = []
+    plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+    if "queryPlan" in plan:
+        plan = plan["queryPlan"]
+    pending = [plan]
+    while pending:
+        stage = pending.pop()
+        stages.append(stage.get("stage", ""))
+        if stage.get("indexName"):
+            indexes.append(stage["indexName"])
+        pending += [child for key in ("inputStage", "outerStage", "innerStage") if (child := stage.get(key))]
+        pending += stage.get("inputStages", [])
+    return {"stages": stages, "indexes": indexes, "collection_scan": "COLLSCAN" in stages}
+
+async def explain_slow_query(key: tuple, command: dict):
+    try:
+        explain = await db.command({"explain": command, "verbosity": "queryPlanner"})
+        summary = plan_summary(explain)
+    except Exception as e:
+        summary = {"error": str(e)}
+    with mongo_metrics_lock:
+        slow_queries[key]["explain"] = summary
+
+def record_slow_query(collection: str, command_name: str, command: dict, route: str, duration_ms: float):
+    shape = command_filter(command_name, command)
+    key = (collection, command_name, json.dumps(shape, sort_keys=True, default=str))
+    with mongo_metrics_lock:
+        entry = slow_queries.get(key)
+        if entry is None:
+            if len(slow_queries) >= SLOW_QUERY_MAX_SHAPES:
+                return
+            entry = slow_queries[key] = {
+                "collection": collection,
+                "command": command_name,
+                "filter": shape,
+                "routes": {},
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "explain": None,
+            }
+        first_seen = entry["count"] == 0
+        entry["count"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+        entry["last_seen"] = datetime.now(timezone.utc).isoformat()
+        entry["routes"][route] = entry["routes"].get(route, 0) + 1
+    loop = slow_query_state["loop"]
+    if first_seen and loop is not None:
+        command = {k: v for k, v in command.items() if k not in SLOW_QUERY_IGNORED_KEYS}
+        asyncio.run_coroutine_threadsafe(explain_slow_query(key, command), loop)
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    def __init__(self):
+        self.pending = {}
+
+    def started(self, event):
+        target = event.command.get("collection" if event.command_name == "getMore" else event.command_name)
+        collection = target if isinstance(target, str) else ""
+        # Runs in Motor's executor thread, which carries the request's context
+        self.pending[(event.connection_id, event.request_id)] = (collection, event.command_name, event.command, current_route.get())
+
+    def succeeded(self, event):
+        self.record(event, failed=False)
+
+    def failed(self, event):
+        self.record(event, failed=True)
+
+    def record(self, event, failed: bool):
+        pending = self.pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        collection, command_name, command, route = pending
+        key = (collection, command_name)
+        with mongo_metrics_lock:
+            observe(mongo_latency, key, event.duration_micros / 1e6)
+            if failed:
+                mongo_failures[key] = mongo_failures.get(key, 0) + 1
+        duration_ms = event.duration_micros / 1000
+        if duration_ms >= SLOW_QUERY_THRESHOLD_MS and command_name in SLOW_QUERY_COMMANDS:
+            record_slow_query(collection, command_name, command, route or "(background)", duration_ms)
+
+def route_template(scope) -> str:
+    # Label by route template, not raw path, to keep ids out of the label set
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match != Match.NONE:
+            return route.path
+    return "unmatched"
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        key = (scope["method"], route_template(scope))
+        current_route.set(" ".join(key))
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        requests_in_flight[key] = requests_in_flight.get(key, 0) + 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_flight[key] -= 1
+            observe(request_latency, key, time.perf_counter() - start)
+            count_key = (*key, str(status[0]))
+            request_counts[count_key] = request_counts.get(count_key, 0) + 1
+
+def metric_labels(names: tuple, values: tuple) -> str:
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+def render_histograms(lines: list, name: str, help_text: str, label_names: tuple, histograms: dict):
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for key, histogram in sorted(histograms.items()):
+        labels = metric_labels(label_names, key)
+        cumulative = 0
+        for bound, count in zip((*METRICS_BUCKETS, "+Inf"), histogram["buckets"]):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram['sum']}")
+        lines.append(f"{name}_count{{{labels}}} {histogram['count']}")
+
+def render_values(lines: list, name: str, kind: str, help_text: str, label_names: tuple, values: dict):
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for key, value in sorted(values.items()):
+        lines.append(f"{name}{{{metric_labels(label_names, key)}}} {value}")
+
+def render_metrics() -> str:
+    with mongo_metrics_lock:
+        mongo_histograms = {key: {**histogram, "buckets": list(histogram["buckets"])} for key, histogram in mongo_latency.items()}
+        failures = dict(mongo_failures)
+    lines = []
+    render_histograms(lines, "http_request_duration_seconds", "Request latency per route.", ("method", "route"), request_latency)
+    render_values(lines, "http_requests_total", "counter", "Requests per route and status code.", ("method", "route", "status"), request_counts)
+    render_values(lines, "http_requests_in_flight", "gauge", "Requests currently being handled per route.", ("method", "route"), requests_in_flight)
+    render_histograms(lines, "mongodb_command_duration_seconds", "MongoDB command latency per collection.", ("collection", "command"), mongo_histograms)
+    render_values(lines, "mongodb_command_failures_total", "counter", "Failed MongoDB commands per collection.", ("collection", "command"), failures)
+    return "\n".join(lines) + "\n"
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True, event_listeners=[MongoCommandMetrics()])
 db = client[os.environ['DB_NAME']]
 
 # Create uploads directory
 UPLOAD_DIR = Path("/app/uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_SIZE = int(os.environ.get("MAX_UPLOAD_SIZE", str(25 * 1024 * 1024)))
+
+# Resized image derivatives (longest edge in px), rendered in a process pool
+IMAGE_VARIANTS = {"thumb": 320, "preview": 1280}
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tif", ".tiff"}
+IMAGE_WORKERS = int(os.environ.get("IMAGE_WORKERS", "2"))
+DERIVATIVE_DIR = UPLOAD_DIR / "derivatives"
+DERIVATIVE_DIR.mkdir(exist_ok=True)
+image_executor = None
+
+# Fields holding upload filenames; files referenced nowhere are collected after the grace period
+UPLOAD_REFERENCES = {
+    "correspondence": ["upload1", "upload2", "upload3"],
+    "client_experiences": ["datei_upload"],
+    "kaufvertraege": ["eintausch_upload_ausweis", "eintausch_upload_aussen", "eintausch_upload_innen", "eintausch_uploads"],
+}
+# Customers not yet migrated by scripts/migrations/0001_customer_notes.py still embed korrespondenz
+LEGACY_UPLOAD_REFERENCES = {
+    "customers": ["korrespondenz.upload1", "korrespondenz.upload2", "korrespondenz.upload3"],
+}
+UPLOAD_GC_GRACE_HOURS = float(os.environ.get("UPLOAD_GC_GRACE_HOURS", "24"))
+UPLOAD_GC_REPORT_LIMIT = 100
 
 
 # Create the main app without a prefix
@@ -44,12 +287,29 @@ SECRET_KEY = os.environ.get("SECRET_KEY", "your-secret-key-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
+# bcrypt runs in a dedicated, size-limited pool so it never blocks the event loop
+PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_MAX_QUEUE = int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", "64"))
+password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+password_pool_stats = {"pending": 0, "peak_pending": 0, "rejected": 0}
+
+async def run_password_task(func, *args):
+    if password_pool_stats["pending"] >= PASSWORD_HASH_MAX_QUEUE:
+        password_pool_stats["rejected"] += 1
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+    password_pool_stats["pending"] += 1
+    password_pool_stats["peak_pending"] = max(password_pool_stats["peak_pending"], password_pool_stats["pending"])
+    try:
+        return await asyncio.get_running_loop().run_in_executor(password_executor, func, *args)
+    finally:
+        password_pool_stats["pending"] -= 1
+
 # Helper functions
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password, hashed_password):
+    return await run_password_task(pwd_context.verify, plain_password, hashed_password)
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    return await run_password_task(pwd_context.hash, password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -61,28 +321,303 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = credentials.credentials
+# Authenticated user cache (bounded LRU with TTL, keyed by user id)
+USER_CACHE_TTL = 60  # seconds
+USER_CACHE_SIZE = 1024
+user_cache = OrderedDict()
+user_cache_stats = {"hits": 0, "misses": 0}
+
+def get_cached_user(user_id: str) -> Optional[dict]:
+    entry = user_cache.get(user_id)
+    if entry is None or entry[0] <= time.monotonic():
+        user_cache_stats["misses"] += 1
+        return None
+    user_cache.move_to_end(user_id)
+    user_cache_stats["hits"] += 1
+    return dict(entry[1])
+
+def cache_user(user: dict):
+    user_cache[user["id"]] = (time.monotonic() + USER_CACHE_TTL, user)
+    user_cache.move_to_end(user["id"])
+    while len(user_cache) > USER_CACHE_SIZE:
+        user_cache.popitem(last=False)
+
+def invalidate_user_cache(user_id: str):
+    user_cache.pop(user_id, None)
+
+async def user_from_token(token: str, scope: Optional[str] = None) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+        # Scoped tokens (event tickets) only open their own route, and access tokens never do
+        if payload.get("scope") != scope:
+            raise HTTPException(status_code=401, detail="Invalid token")
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
     
-    user = await db.users.find_one({"id": user_id}, {"_id": 0})
+    user = get_cached_user(user_id)
+    if user is not None:
+        return user
+    
+    user = await db.users.find_one({"id": user_id}, {"_id": 0, "password": 0})
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
-    return user
+    cache_user(user)
+    return dict(user)
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    return await user_from_token(credentials.credentials)
 
 async def get_admin_user(current_user: dict = Depends(get_current_user)):
     if current_user.get("role") != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
 
+# Pagination helpers (keyset on created_at + id, or on another sort ending in id)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+PAGINATION_SORT = [("created_at", 1), ("id", 1)]
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CURSOR_DATETIME_FIELDS = {"created_at"}
+
+def encode_cursor(doc: dict, sort: list = PAGINATION_SORT) -> str:
+    values = [doc[field].isoformat() if field in CURSOR_DATETIME_FIELDS else doc.get(field) for field, _ in sort]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+def decode_cursor(cursor: str, sort: list = PAGINATION_SORT) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(sort):
+            raise ValueError(cursor)
+        return [datetime.fromisoformat(value) if field in CURSOR_DATETIME_FIELDS else value for (field, _), value in zip(sort, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def after_cursor(sort: list, values: list) -> dict:
+    # Past the cursor on the first sort key, or tied on the earlier keys and past it on the next one
+    clauses = []
+    for index, (field, direction) in enumerate(sort):
+        clause = {earlier: value for (earlier, _), value in zip(sort[:index], values)}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[index]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+async def paginate(collection, query: dict, projection: dict, limit: int, after: Optional[str], response: Response, sort: list = PAGINATION_SORT) -> list:
+    if after:
+        query = {"$and": [query, after_cursor(sort, decode_cursor(after, sort))]}
+    docs = await collection.find(query, projection).sort(sort).limit(limit + 1).to_list(limit + 1)
+    if len(docs) > limit:
+        docs = docs[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(docs[-1], sort)
+    return docs
+
+def created_range(created_from: Optional[datetime], created_to: Optional[datetime]) -> dict:
+    bounds = {}
+    if created_from:
+        bounds["$gte"] = created_from
+    if created_to:
+        bounds["$lt"] = created_to
+    return {"created_at": bounds} if bounds else {}
+
+# Conditional GETs: ETags derive from per-collection write counters that every write handler bumps
+async def bump_versions(*collections: str):
+    await db.collection_versions.bulk_write(
+        [UpdateOne({"_id": name}, {"$inc": {"version": 1}}, upsert=True) for name in collections],
+        ordered=False
+    )
+
+async def not_modified(request: Request, response: Response, *collections: str) -> Optional[Response]:
+    versions = {doc["_id"]: doc["version"] async for doc in db.collection_versions.find({"_id": {"$in": list(collections)}})}
+    key = f"{request.url.path}?{request.url.query}|" + ",".join(f"{name}:{versions.get(name, 0)}" for name in collections)
+    etag = f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+# Calendar dates (YYYY-MM-DD in the API) are stored as BSON datetimes at midnight UTC
+def parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        if not value:
+            return None
+        for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
+            try:
+                return datetime.strptime(value, fmt).date()
+            except ValueError:
+                pass
+        raise ValueError(f"Ungültiges Datum: {value} (erwartet YYYY-MM-DD oder TT.MM.JJJJ)")
+    return value
+
+def store_dates(doc: dict) -> dict:
+    for key, value in doc.items():
+        if isinstance(value, date) and not isinstance(value, datetime):
+            doc[key] = datetime.combine(value, datetime.min.time(), tzinfo=timezone.utc)
+    return doc
+
+def parse_stored_date(value):
+    # Legacy rows and CSV imports may hold free text ("03/2019"); return it raw instead of failing the list
+    try:
+        return parse_date(value)
+    except ValueError:
+        return value
+
+def format_date(value) -> str:
+    return value.isoformat() if isinstance(value, date) else value or ""
+
+DateField = Annotated[date, BeforeValidator(parse_date), PlainSerializer(lambda v: v.isoformat(), return_type=str, when_used="json")]
+OptionalDateField = Annotated[Optional[date], BeforeValidator(parse_date), PlainSerializer(format_date, return_type=str, when_used="json")]
+StoredDateField = Annotated[Union[date, str], BeforeValidator(parse_stored_date), PlainSerializer(format_date, return_type=str, when_used="json")]
+OptionalStoredDateField = Annotated[Optional[Union[date, str]], BeforeValidator(parse_stored_date), PlainSerializer(format_date, return_type=str, when_used="json")]
+
+# Customer search helpers (normalized prefix terms over name, vorname, kunden_nr, firma)
+SEARCH_FIELDS = ("name", "vorname", "kunden_nr", "firma")
+SEARCH_PAGE_SIZE = 50
+
+def search_tokens(text: str) -> List[str]:
+    return [token for token in text.lower().split() if token]
+
+def customer_search_terms(customer: dict) -> List[str]:
+    terms = set()
+    for field in SEARCH_FIELDS:
+        terms.update(search_tokens(customer.get(field) or ""))
+    return sorted(terms)
+
+# Customer order by name; without it the list keeps creation order and search ranks by relevance
+CustomerSort = Literal["name", "-name"]
+CUSTOMER_SORTS = {"name": [("name", 1), ("id", 1)], "-name": [("name", -1), ("id", -1)]}
+
+# Vehicle search, a case-insensitive substring match like the list page's former client-side filter
+VEHICLE_SEARCH_FIELDS = ("marke", "modell", "chassis_nr")
+
+def vehicle_search_query(q: str) -> dict:
+    pattern = re.escape(q.strip())
+    return {"$or": [{field: {"$regex": pattern, "$options": "i"}} for field in VEHICLE_SEARCH_FIELDS]}
+
+# CSV import
+IMPORT_BATCH_SIZE = 1000
+
+# CSV/NDJSON export, same columns the importers read
+EXPORT_BATCH_SIZE = 1000
+CUSTOMER_EXPORT_COLUMNS = ["kunden_nr", "vorname", "name", "firma", "strasse", "plz", "ort", "telefon_p", "telefon_g", "natel", "email_p", "email_g", "geburtsdatum"]
+VEHICLE_EXPORT_COLUMNS = ["kunden_nr", "marke", "modell", "chassis_nr", "stamm_nr", "typenschein_nr", "farbe", "inverkehrsetzung", "km_stand", "vista_nr", "verkaeufer", "kundenberater"]
+ExportFormat = Literal["csv", "ndjson"]
+
+def export_row(doc: dict, columns: list) -> dict:
+    row = {}
+    for column in columns:
+        value = doc.get(column)
+        if isinstance(value, datetime):
+            value = value.date().isoformat()
+        row[column] = "" if value is None else value
+    return row
+
+def render_export_batch(docs: list, columns: list, format: ExportFormat) -> bytes:
+    if format == "ndjson":
+        return b"".join(orjson.dumps(export_row(doc, columns)) + b"\n" for doc in docs)
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=columns).writerows(export_row(doc, columns) for doc in docs)
+    return buffer.getvalue().encode("utf-8")
+
+async def iter_export_batches(cursor):
+    batch = []
+    async for doc in cursor.batch_size(EXPORT_BATCH_SIZE):
+        batch.append(doc)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def export_response(chunks, format: ExportFormat, filename: str, columns: list) -> StreamingResponse:
+    async def body():
+        if format == "csv":
+            # BOM so Excel detects UTF-8; the importers read utf-8-sig
+            yield ("\ufeff" + ",".join(columns) + "\r\n").encode("utf-8")
+        async for chunk in chunks:
+            yield chunk
+    media_type = "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(body(), media_type=media_type, headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'})
+
+# Dashboard stats cache (short TTL, dropped on writes that change counts)
+STATS_CACHE_TTL = 30  # seconds
+stats_cache = {"expires": 0.0}
+
+def invalidate_stats_cache():
+    stats_cache["expires"] = 0.0
+
+# Live events (SSE): write handlers publish to an in-process bus, optionally fed by a Mongo change stream
+EVENT_QUEUE_SIZE = 100
+EVENT_HEARTBEAT = 15  # seconds
+EVENT_RETRY_DELAY = 1  # seconds, doubled after every failed change stream attempt
+EVENT_RETRY_MAX_DELAY = 60
+EVENT_TICKET_SCOPE = "events"
+EVENT_TICKET_EXPIRE_SECONDS = 60  # Only checked on connect, the stream itself stays open
+EVENT_CHANGE_STREAM = os.environ.get("EVENT_CHANGE_STREAM", "").lower() in ("1", "true", "yes")
+EVENT_COLLECTIONS = {"tasks": "task", "client_experiences": "client_experience"}
+event_subscribers = set()  # One queue per open stream
+event_source = {"change_stream": False, "watcher": None}
+
+def publish_event(event_type: str, action: str, doc: dict):
+    event = {"type": event_type, "action": action, "data": EVENT_MODELS[event_type].model_validate(doc).model_dump(mode="json")}
+    # Every user can list all tasks and complaints, so every stream gets every event
+    for queue in list(event_subscribers):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            pass  # Slow client, it reloads its lists on reconnect
+
+def notify_change(event_type: str, action: str, doc: dict):
+    # With a change stream, inserts and updates of every worker arrive from there instead
+    if event_source["change_stream"] and action != "deleted":
+        return
+    publish_event(event_type, action, doc)
+
+async def watch_changes():
+    pipeline = [{"$match": {
+        "operationType": {"$in": ["insert", "update", "replace"]},
+        "ns.coll": {"$in": list(EVENT_COLLECTIONS)},
+    }}]
+    resume_token = None
+    delay = EVENT_RETRY_DELAY
+    try:
+        while True:
+            try:
+                async with db.watch(pipeline, full_document="updateLookup", resume_after=resume_token) as stream:
+                    resume_token = stream.resume_token
+                    event_source["change_stream"] = True
+                    delay = EVENT_RETRY_DELAY
+                    logger.info("Publishing live events from the MongoDB change stream")
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        if change.get("fullDocument"):
+                            action = "created" if change["operationType"] == "insert" else "updated"
+                            publish_event(EVENT_COLLECTIONS[change["ns"]["coll"]], action, change["fullDocument"])
+            except OperationFailure as e:
+                if resume_token is None:
+                    # No replica set, change streams will never work here
+                    logger.warning(f"Change stream unavailable, publishing live events in-process: {e}")
+                    return
+                # Most likely the resume point fell out of the oplog, start over from now
+                logger.error(f"Change stream failed, restarting it without resuming: {e}")
+                resume_token = None
+            except (ConnectionFailure, ServerSelectionTimeoutError) as e:
+                logger.error(f"Change stream lost its connection, retrying in {delay}s: {e}")
+            # Until the stream is back this worker publishes its own writes in-process; replayed
+            # events after resuming may repeat some of them, which the clients apply idempotently
+            event_source["change_stream"] = False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, EVENT_RETRY_MAX_DELAY)
+    finally:
+        event_source["change_stream"] = False
+
 # Models
 class UserBase(BaseModel):
     username: str
@@ -107,11 +642,17 @@ class LoginResponse(BaseModel):
     user: User
 
 class Remark(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    customer_id: str
     text: str
     timestamp: str
     user: str
 
 class Correspondence(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    customer_id: str
     bemerkung: str
     datum: str
     zeit: str
@@ -138,8 +679,6 @@ class Customer(BaseModel):
     email_p: Optional[str] = ""
     email_g: Optional[str] = ""
     geburtsdatum: Optional[str] = ""
-    bemerkungen: List[dict] = Field(default_factory=list)
-    korrespondenz: List[dict] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class CustomerCreate(BaseModel):
@@ -179,7 +718,7 @@ class Vehicle(BaseModel):
     stamm_nr: Optional[str] = ""
     typenschein_nr: Optional[str] = ""
     farbe: Optional[str] = ""
-    inverkehrsetzung: Optional[str] = ""
+    inverkehrsetzung: OptionalStoredDateField = None
     km_stand: Optional[str] = ""
     vista_nr: Optional[str] = ""
     verkaeufer: Optional[str] = ""
@@ -194,7 +733,7 @@ class VehicleCreate(BaseModel):
     stamm_nr: Optional[str] = ""
     typenschein_nr: Optional[str] = ""
     farbe: Optional[str] = ""
-    inverkehrsetzung: Optional[str] = ""
+    inverkehrsetzung: OptionalDateField = None
     km_stand: Optional[str] = ""
     vista_nr: Optional[str] = ""
     verkaeufer: Optional[str] = ""
@@ -210,8 +749,8 @@ class Employee(BaseModel):
     ort: str
     email: str
     telefon: str
-    eintritt_firma: str  # Date as string (YYYY-MM-DD)
-    geburtstag: str  # Date as string (YYYY-MM-DD)
+    eintritt_firma: StoredDateField
+    geburtstag: StoredDateField
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class EmployeeCreate(BaseModel):
@@ -222,15 +761,15 @@ class EmployeeCreate(BaseModel):
     ort: str
     email: str
     telefon: str
-    eintritt_firma: str
-    geburtstag: str
+    eintritt_firma: DateField
+    geburtstag: DateField
 
 class Task(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     customer_id: str
     customer_name: str
-    datum_kontakt: str
+    datum_kontakt: StoredDateField
     zeitpunkt_kontakt: str
     bemerkungen: str
     telefon_nummer: str
@@ -243,7 +782,7 @@ class Task(BaseModel):
 class TaskCreate(BaseModel):
     customer_id: str
     customer_name: str
-    datum_kontakt: str
+    datum_kontakt: DateField
     zeitpunkt_kontakt: str
     bemerkungen: str
     telefon_nummer: str
@@ -352,6 +891,96 @@ class KaufvertragCreate(BaseModel):
     eintausch_upload_innen: Optional[str] = ""
     eintausch_uploads: List[str] = Field(default_factory=list)
 
+class CustomerFull(BaseModel):
+    customer: Customer
+    remarks: List[Remark]
+    correspondence: List[Correspondence]
+    vehicles: List[Vehicle]
+    tasks: List[Task]
+    client_experiences: List[ClientExperience]
+    kaufvertraege: List[Kaufvertrag]
+
+# Lean list views: only the columns the list pages render
+class CustomerSummary(BaseModel):
+    id: str
+    kunden_nr: str
+    vorname: str
+    name: str
+    firma: Optional[str] = ""
+    ort: str
+    telefon_p: Optional[str] = ""
+    telefon_g: Optional[str] = ""
+    natel: Optional[str] = ""
+    email_p: Optional[str] = ""
+    email_g: Optional[str] = ""
+    geburtsdatum: Optional[str] = ""
+    created_at: datetime
+
+class VehicleSummary(BaseModel):
+    id: str
+    customer_id: str
+    marke: str
+    modell: str
+    chassis_nr: str
+    farbe: Optional[str] = ""
+    km_stand: Optional[str] = ""
+    verkaeufer: Optional[str] = ""
+    kundenberater: Optional[str] = ""
+    created_at: datetime
+
+class ClientExperienceSummary(BaseModel):
+    id: str
+    customer_id: Optional[str] = ""
+    customer_name: str
+    marke: str
+    modell: str
+    datum: str
+    zeit: str
+    status: str
+    created_at: datetime
+    created_by: str
+
+class KaufvertragSummary(BaseModel):
+    id: str
+    kunde_name: str
+    kunde_vorname: str
+    fahrzeug_marke: str
+    fahrzeug_modell: str
+    fahrzeug_typ: str
+    verkaufspreis: str
+    created_at: datetime
+    created_by: str
+
+ListView = Literal["full", "summary"]
+
+EVENT_MODELS = {"task": Task, "client_experience": ClientExperience}
+
+# Opt-in: serialize full list views straight from Mongo rows with orjson
+FAST_JSON_RESPONSES = os.environ.get("FAST_JSON_RESPONSES", "").lower() in ("1", "true", "yes")
+
+def fast_json_response(docs: list, response: Response, date_fields: tuple = ()) -> Response:
+    # Rows are trusted DB data; only calendar dates need their API format
+    for doc in docs:
+        for field in date_fields:
+            value = doc.get(field)
+            if isinstance(value, datetime):
+                doc[field] = value.date().isoformat()
+            elif value is None and field in doc:
+                doc[field] = ""
+    return Response(content=orjson.dumps(docs, option=orjson.OPT_UTC_Z), media_type="application/json", headers=dict(response.headers))
+
+def view_projection(model) -> dict:
+    return {"_id": 0, **{field: 1 for field in model.model_fields}}
+
+@lru_cache(maxsize=None)
+def list_adapter(model) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+def view_response(docs: list, model, response: Response) -> Response:
+    # Serialized straight through the lean model, bypassing the route's full response_model
+    adapter = list_adapter(model)
+    return Response(content=adapter.dump_json(adapter.validate_python(docs)), media_type="application/json", headers=dict(response.headers))
+
 # Routes
 @api_router.get("/")
 async def root():
@@ -361,7 +990,7 @@ async def root():
 @api_router.post("/auth/login", response_model=LoginResponse)
 async def login(login_data: LoginRequest):
     user = await db.users.find_one({"username": login_data.username}, {"_id": 0})
-    if not user or not verify_password(login_data.password, user["password"]):
+    if not user or not await verify_password(login_data.password, user["password"]):
         raise HTTPException(status_code=401, detail="Incorrect username or password")
     
     access_token = create_access_token(data={"sub": user["id"]})
@@ -388,22 +1017,23 @@ async def create_user(user_data: UserCreate, admin: dict = Depends(get_admin_use
         raise HTTPException(status_code=400, detail="Username already exists")
     
     user_dict = user_data.model_dump()
-    user_dict["password"] = get_password_hash(user_dict["password"])
+    user_dict["password"] = await get_password_hash(user_dict["password"])
     user_obj = User(**{k: v for k, v in user_dict.items() if k != "password"})
     
     doc = user_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
     doc["password"] = user_dict["password"]
     
     await db.users.insert_one(doc)
+    await bump_versions("users")
     return user_obj
 
 @api_router.get("/users", response_model=List[User])
-async def get_users(current_user: dict = Depends(get_current_user)):
-    users = await db.users.find({}, {"_id": 0, "password": 0}).to_list(1000)
-    for user in users:
-        if isinstance(user["created_at"], str):
-            user["created_at"] = datetime.fromisoformat(user["created_at"])
+async def get_users(request: Request, response: Response, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    if cached := await not_modified(request, response, "users"):
+        return cached
+    users = await paginate(db.users, {}, {"_id": 0, "password": 0}, limit, after, response)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(users, response)
     return users
 
 @api_router.delete("/users/{user_id}")
@@ -411,46 +1041,162 @@ async def delete_user(user_id: str, admin: dict = Depends(get_admin_user)):
     result = await db.users.delete_one({"id": user_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="User not found")
+    invalidate_user_cache(user_id)
+    await bump_versions("users")
     return {"message": "User deleted"}
 
+@api_router.get("/admin/stats")
+async def get_runtime_stats(admin: dict = Depends(get_admin_user)):
+    return {
+        "user_cache": {
+            "size": len(user_cache),
+            "max_size": USER_CACHE_SIZE,
+            "ttl_seconds": USER_CACHE_TTL,
+            **user_cache_stats,
+        },
+        "password_pool": {
+            "workers": PASSWORD_HASH_WORKERS,
+            "max_queue": PASSWORD_HASH_MAX_QUEUE,
+            "running": min(password_pool_stats["pending"], PASSWORD_HASH_WORKERS),
+            "queued": max(password_pool_stats["pending"] - PASSWORD_HASH_WORKERS, 0),
+            **password_pool_stats,
+        },
+    }
+
+@api_router.get("/metrics")
+async def get_metrics(request: Request):
+    # Scraped by Prometheus, optionally protected with a static bearer token
+    if METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return Response(content=render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@api_router.get("/admin/slow-queries")
+async def get_slow_queries(limit: int = Query(50, ge=1, le=SLOW_QUERY_MAX_SHAPES), admin: dict = Depends(get_admin_user)):
+    with mongo_metrics_lock:
+        entries = [{**entry, "routes": dict(entry["routes"])} for entry in slow_queries.values()]
+    # Ranked by total time spent, so frequent moderately slow queries surface too
+    entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+    return {
+        "threshold_ms": SLOW_QUERY_THRESHOLD_MS,
+        "queries": [{**entry, "avg_ms": entry["total_ms"] / entry["count"]} for entry in entries[:limit]],
+    }
+
 # Customer routes
 @api_router.post("/customers", response_model=Customer)
 async def create_customer(customer_data: CustomerCreate, current_user: dict = Depends(get_current_user)):
     customer_obj = Customer(**customer_data.model_dump())
     doc = customer_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
+    doc["search_terms"] = customer_search_terms(doc)
     await db.customers.insert_one(doc)
+    await bump_versions("customers")
+    invalidate_stats_cache()
     return customer_obj
 
 @api_router.get("/customers", response_model=List[Customer])
-async def get_customers(current_user: dict = Depends(get_current_user)):
-    customers = await db.customers.find({}, {"_id": 0}).to_list(1000)
-    for customer in customers:
-        if isinstance(customer["created_at"], str):
-            customer["created_at"] = datetime.fromisoformat(customer["created_at"])
+async def get_customers(request: Request, response: Response, view: ListView = "full", sort: Optional[CustomerSort] = None, ids: List[str] = Query([], max_length=MAX_PAGE_SIZE), created_from: Optional[datetime] = None, created_to: Optional[datetime] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    if cached := await not_modified(request, response, "customers"):
+        return cached
+    query = created_range(created_from, created_to)
+    # Lets list pages resolve the customers of the rows they show instead of loading all customers
+    if ids:
+        query["id"] = {"$in": ids}
+    order = CUSTOMER_SORTS[sort] if sort else PAGINATION_SORT
+    if view == "summary":
+        customers = await paginate(db.customers, query, view_projection(CustomerSummary), limit, after, response, order)
+        return view_response(customers, CustomerSummary, response)
+    customers = await paginate(db.customers, query, {"_id": 0, "search_terms": 0, "bemerkungen": 0, "korrespondenz": 0}, limit, after, response, order)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(customers, response)
+    return customers
+
+@api_router.get("/customers/search", response_model=List[Customer])
+async def search_customers(response: Response, q: str = Query(..., min_length=1), sort: Optional[CustomerSort] = None, limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    tokens = search_tokens(q)
+    if not tokens:
+        return []
+    try:
+        offset = int(after) if after else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    # Every token must prefix-match a term; exact term and kunden_nr hits rank first
+    pipeline = [
+        {"$match": {"$and": [{"search_terms": {"$regex": f"^{re.escape(token)}"}} for token in tokens]}},
+        {"$addFields": {"_score": {"$add": [
+            {"$cond": [{"$eq": [{"$toLower": "$kunden_nr"}, " ".join(tokens)]}, 10, 0]},
+            *[{"$cond": [{"$in": [token, "$search_terms"]}, 2, 0]} for token in tokens],
+        ]}}},
+        {"$sort": dict(CUSTOMER_SORTS[sort]) if sort else {"_score": -1, "name": 1, "vorname": 1, "id": 1}},
+        {"$skip": offset},
+        {"$limit": limit + 1},
+        {"$project": {"_id": 0, "_score": 0, "search_terms": 0, "bemerkungen": 0, "korrespondenz": 0}},
+    ]
+    customers = await db.customers.aggregate(pipeline).to_list(limit + 1)
+    if len(customers) > limit:
+        customers = customers[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = str(offset + limit)
     return customers
 
+@api_router.get("/customers/export")
+async def export_customers(format: ExportFormat = "csv", current_user: dict = Depends(get_current_user)):
+    async def chunks():
+        cursor = db.customers.find({}, {"_id": 0, **{column: 1 for column in CUSTOMER_EXPORT_COLUMNS}}).sort(PAGINATION_SORT)
+        async for batch in iter_export_batches(cursor):
+            yield render_export_batch(batch, CUSTOMER_EXPORT_COLUMNS, format)
+    return export_response(chunks(), format, "kunden", CUSTOMER_EXPORT_COLUMNS)
+
 @api_router.get("/customers/{customer_id}", response_model=Customer)
-async def get_customer(customer_id: str, current_user: dict = Depends(get_current_user)):
+async def get_customer(customer_id: str, request: Request, response: Response, current_user: dict = Depends(get_current_user)):
+    if cached := await not_modified(request, response, "customers"):
+        return cached
     customer = await db.customers.find_one({"id": customer_id}, {"_id": 0})
     if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
-    if isinstance(customer["created_at"], str):
-        customer["created_at"] = datetime.fromisoformat(customer["created_at"])
     return customer
 
-@api_router.put("/customers/{customer_id}", response_model=Customer)
-async def update_customer(customer_id: str, customer_data: CustomerCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.customers.find_one({"id": customer_id})
-    if not existing:
+@api_router.get("/customers/{customer_id}/full", response_model=CustomerFull)
+async def get_customer_full(customer_id: str, request: Request, response: Response, current_user: dict = Depends(get_current_user)):
+    if cached := await not_modified(request, response, "customers", "remarks", "correspondence", "vehicles", "tasks", "client_experiences", "kaufvertraege"):
+        return cached
+    customer = await db.customers.find_one({"id": customer_id}, {"_id": 0, "search_terms": 0})
+    if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
     
-    update_data = customer_data.model_dump()
-    await db.customers.update_one({"id": customer_id}, {"$set": update_data})
+    # Kaufverträge carry no customer_id, they are matched on the customer's name
+    remarks, correspondence, vehicles, tasks, experiences, vertraege = await asyncio.gather(
+        db.remarks.find({"customer_id": customer_id}, {"_id": 0}).sort(PAGINATION_SORT).to_list(MAX_PAGE_SIZE),
+        db.correspondence.find({"customer_id": customer_id}, {"_id": 0}).sort(PAGINATION_SORT).to_list(MAX_PAGE_SIZE),
+        db.vehicles.find({"customer_id": customer_id}, {"_id": 0}).sort(PAGINATION_SORT).to_list(MAX_PAGE_SIZE),
+        db.tasks.find({"customer_id": customer_id}, {"_id": 0}).sort(PAGINATION_SORT).to_list(MAX_PAGE_SIZE),
+        db.client_experiences.find({"customer_id": customer_id}, {"_id": 0}).sort(PAGINATION_SORT).to_list(MAX_PAGE_SIZE),
+        db.kaufvertraege.find(
+            {"kunde_name": customer["name"], "kunde_vorname": customer["vorname"]}, {"_id": 0}
+        ).sort(PAGINATION_SORT).to_list(MAX_PAGE_SIZE),
+    )
     
-    updated = await db.customers.find_one({"id": customer_id}, {"_id": 0})
-    if isinstance(updated["created_at"], str):
-        updated["created_at"] = datetime.fromisoformat(updated["created_at"])
+    return {
+        "customer": customer,
+        "remarks": remarks,
+        "correspondence": correspondence,
+        "vehicles": vehicles,
+        "tasks": tasks,
+        "client_experiences": experiences,
+        "kaufvertraege": vertraege,
+    }
+
+@api_router.put("/customers/{customer_id}", response_model=Customer)
+async def update_customer(customer_id: str, customer_data: CustomerCreate, current_user: dict = Depends(get_current_user)):
+    update_data = customer_data.model_dump()
+    update_data["search_terms"] = customer_search_terms(update_data)
+    updated = await db.customers.find_one_and_update(
+        {"id": customer_id},
+        {"$set": update_data},
+        projection={"_id": 0, "search_terms": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Customer not found")
+    await bump_versions("customers")
     return updated
 
 @api_router.delete("/customers/{customer_id}")
@@ -458,97 +1204,125 @@ async def delete_customer(customer_id: str, current_user: dict = Depends(get_cur
     result = await db.customers.delete_one({"id": customer_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Customer not found")
-    # Also delete associated vehicles
-    await db.vehicles.delete_many({"customer_id": customer_id})
+    # Also delete associated vehicles, remarks and correspondence
+    await asyncio.gather(
+        db.vehicles.delete_many({"customer_id": customer_id}),
+        db.remarks.delete_many({"customer_id": customer_id}),
+        db.correspondence.delete_many({"customer_id": customer_id}),
+    )
+    await bump_versions("customers", "vehicles", "remarks", "correspondence")
+    invalidate_stats_cache()
     return {"message": "Customer deleted"}
 
 
 # Customer Remarks routes
 @api_router.post("/customers/{customer_id}/remarks")
 async def add_remark(customer_id: str, remark_data: RemarkCreate, current_user: dict = Depends(get_current_user)):
-    customer = await db.customers.find_one({"id": customer_id})
+    # Covered by the id index, no document fetch
+    customer = await db.customers.find_one({"id": customer_id}, {"_id": 0, "id": 1})
     if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
     
-    new_remark = {
-        "text": remark_data.text,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "user": current_user["name"]
-    }
-    
-    await db.customers.update_one(
-        {"id": customer_id},
-        {"$push": {"bemerkungen": new_remark}}
+    now = datetime.now(timezone.utc)
+    remark_obj = Remark(
+        customer_id=customer_id,
+        text=remark_data.text,
+        timestamp=now.isoformat(),
+        user=current_user["name"]
     )
+    new_remark = remark_obj.model_dump()
+    await db.remarks.insert_one({**new_remark, "created_at": now})
+    await bump_versions("remarks")
     
     return {"message": "Remark added", "remark": new_remark}
 
+@api_router.get("/customers/{customer_id}/remarks", response_model=List[Remark])
+async def get_remarks(customer_id: str, response: Response, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    return await paginate(db.remarks, {"customer_id": customer_id}, {"_id": 0}, limit, after, response)
+
 # Customer Correspondence routes
 @api_router.post("/customers/{customer_id}/correspondence")
 async def add_correspondence(customer_id: str, correspondence_data: CorrespondenceCreate, current_user: dict = Depends(get_current_user)):
-    customer = await db.customers.find_one({"id": customer_id})
+    # Covered by the id index, no document fetch
+    customer = await db.customers.find_one({"id": customer_id}, {"_id": 0, "id": 1})
     if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
     
-    new_correspondence = {
-        "bemerkung": correspondence_data.bemerkung,
-        "datum": correspondence_data.datum,
-        "zeit": correspondence_data.zeit,
-        "textfeld": correspondence_data.textfeld,
-        "upload1": correspondence_data.upload1,
-        "upload2": correspondence_data.upload2,
-        "upload3": correspondence_data.upload3,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "user": current_user["name"]
-    }
-    
-    await db.customers.update_one(
-        {"id": customer_id},
-        {"$push": {"korrespondenz": new_correspondence}}
+    now = datetime.now(timezone.utc)
+    correspondence_obj = Correspondence(
+        customer_id=customer_id,
+        **correspondence_data.model_dump(),
+        timestamp=now.isoformat(),
+        user=current_user["name"]
     )
+    new_correspondence = correspondence_obj.model_dump()
+    await db.correspondence.insert_one({**new_correspondence, "created_at": now})
+    await bump_versions("correspondence")
     
     return {"message": "Correspondence added", "correspondence": new_correspondence}
 
+@api_router.get("/customers/{customer_id}/correspondence", response_model=List[Correspondence])
+async def get_correspondence(customer_id: str, response: Response, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    return await paginate(db.correspondence, {"customer_id": customer_id}, {"_id": 0}, limit, after, response)
+
 
 # Vehicle routes
 @api_router.post("/vehicles", response_model=Vehicle)
 async def create_vehicle(vehicle_data: VehicleCreate, current_user: dict = Depends(get_current_user)):
     vehicle_obj = Vehicle(**vehicle_data.model_dump())
-    doc = vehicle_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
+    doc = store_dates(vehicle_obj.model_dump())
     await db.vehicles.insert_one(doc)
+    await bump_versions("vehicles")
+    invalidate_stats_cache()
     return vehicle_obj
 
 @api_router.get("/vehicles", response_model=List[Vehicle])
-async def get_vehicles(customer_id: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+async def get_vehicles(response: Response, customer_id: Optional[str] = None, q: Optional[str] = None, view: ListView = "full", limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
     query = {"customer_id": customer_id} if customer_id else {}
-    vehicles = await db.vehicles.find(query, {"_id": 0}).to_list(1000)
-    for vehicle in vehicles:
-        if isinstance(vehicle["created_at"], str):
-            vehicle["created_at"] = datetime.fromisoformat(vehicle["created_at"])
+    if q and q.strip():
+        query.update(vehicle_search_query(q))
+    if view == "summary":
+        vehicles = await paginate(db.vehicles, query, view_projection(VehicleSummary), limit, after, response)
+        return view_response(vehicles, VehicleSummary, response)
+    vehicles = await paginate(db.vehicles, query, {"_id": 0}, limit, after, response)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(vehicles, response, ("inverkehrsetzung",))
     return vehicles
 
+@api_router.get("/vehicles/export")
+async def export_vehicles(format: ExportFormat = "csv", current_user: dict = Depends(get_current_user)):
+    async def chunks():
+        cursor = db.vehicles.find({}, {"_id": 0, "customer_id": 1, **{column: 1 for column in VEHICLE_EXPORT_COLUMNS}}).sort(PAGINATION_SORT)
+        async for batch in iter_export_batches(cursor):
+            # The importer matches vehicles to customers by kunden_nr, resolve it per batch
+            customer_ids = list({vehicle["customer_id"] for vehicle in batch})
+            kunden_nrs = {}
+            async for customer in db.customers.find({"id": {"$in": customer_ids}}, {"_id": 0, "id": 1, "kunden_nr": 1}):
+                kunden_nrs[customer["id"]] = customer["kunden_nr"]
+            for vehicle in batch:
+                vehicle["kunden_nr"] = kunden_nrs.get(vehicle["customer_id"], "")
+            yield render_export_batch(batch, VEHICLE_EXPORT_COLUMNS, format)
+    return export_response(chunks(), format, "fahrzeuge", VEHICLE_EXPORT_COLUMNS)
+
 @api_router.get("/vehicles/{vehicle_id}", response_model=Vehicle)
 async def get_vehicle(vehicle_id: str, current_user: dict = Depends(get_current_user)):
     vehicle = await db.vehicles.find_one({"id": vehicle_id}, {"_id": 0})
     if not vehicle:
         raise HTTPException(status_code=404, detail="Vehicle not found")
-    if isinstance(vehicle["created_at"], str):
-        vehicle["created_at"] = datetime.fromisoformat(vehicle["created_at"])
     return vehicle
 
 @api_router.put("/vehicles/{vehicle_id}", response_model=Vehicle)
 async def update_vehicle(vehicle_id: str, vehicle_data: VehicleCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.vehicles.find_one({"id": vehicle_id})
-    if not existing:
+    update_data = store_dates(vehicle_data.model_dump())
+    updated = await db.vehicles.find_one_and_update(
+        {"id": vehicle_id},
+        {"$set": update_data},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
         raise HTTPException(status_code=404, detail="Vehicle not found")
-    
-    update_data = vehicle_data.model_dump()
-    await db.vehicles.update_one({"id": vehicle_id}, {"$set": update_data})
-    
-    updated = await db.vehicles.find_one({"id": vehicle_id}, {"_id": 0})
-    if isinstance(updated["created_at"], str):
-        updated["created_at"] = datetime.fromisoformat(updated["created_at"])
+    await bump_versions("vehicles")
     return updated
 
 @api_router.delete("/vehicles/{vehicle_id}")
@@ -556,55 +1330,124 @@ async def delete_vehicle(vehicle_id: str, current_user: dict = Depends(get_curre
     result = await db.vehicles.delete_one({"id": vehicle_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Vehicle not found")
+    await bump_versions("vehicles")
+    invalidate_stats_cache()
     return {"message": "Vehicle deleted"}
 
 
 # CSV Upload routes
+def read_csv_batch(reader: csv.DictReader, size: int) -> tuple:
+    # Returns (rows, error); a malformed row ends the import after the rows read so far
+    batch = []
+    try:
+        for row in reader:
+            batch.append((reader.line_num, row))
+            if len(batch) >= size:
+                break
+    except csv.Error as e:
+        return batch, f"Nach Zeile {reader.line_num}: {e}"
+    return batch, None
+
+def find_undecodable_line(buffer) -> Optional[int]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    line_num = 0
+    try:
+        for line_num, line in enumerate(iter(buffer.readline, b""), 1):
+            decoder.decode(line)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return line_num
+    return None
+
+async def iter_csv_batches(file: UploadFile, errors: list):
+    # Batches are inserted as they are read, so the encoding is checked up front: nothing is imported from a bad file
+    await file.seek(0)
+    if line_num := await run_in_threadpool(find_undecodable_line, file.file):
+        raise ValueError(f"Zeile {line_num} ist nicht UTF-8-kodiert, bitte die Datei als UTF-8 speichern")
+    # Decode the spooled upload incrementally instead of loading it into memory
+    await file.seek(0)
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        while True:
+            batch, error = await run_in_threadpool(read_csv_batch, reader, IMPORT_BATCH_SIZE)
+            if batch:
+                yield batch
+            if error:
+                errors.append(f"{error} (Import hier abgebrochen)")
+                break
+            if not batch:
+                break
+    finally:
+        text.detach()
+
+async def insert_import_batch(collection, docs: list, line_nums: list, errors: list) -> set:
+    # Returns the positions of docs that failed to insert
+    if not docs:
+        return set()
+    try:
+        await collection.insert_many(docs, ordered=False)
+        return set()
+    except BulkWriteError as e:
+        for error in e.details["writeErrors"]:
+            errors.append(f"Zeile {line_nums[error['index']]}: {error['errmsg']}")
+        return {error["index"] for error in e.details["writeErrors"]}
+
 @api_router.post("/customers/upload-csv")
 async def upload_customers_csv(file: UploadFile = File(...), current_user: dict = Depends(get_current_user)):
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
     try:
-        contents = await file.read()
-        csv_data = contents.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_data))
-        
         imported_count = 0
         errors = []
         
-        for row_num, row in enumerate(csv_reader, start=2):
-            try:
-                customer_data = {
-                    "kunden_nr": row.get("kunden_nr", ""),
-                    "vorname": row.get("vorname", ""),
-                    "name": row.get("name", ""),
-                    "firma": row.get("firma", ""),
-                    "strasse": row.get("strasse", ""),
-                    "plz": row.get("plz", ""),
-                    "ort": row.get("ort", ""),
-                    "telefon_p": row.get("telefon_p", ""),
-                    "telefon_g": row.get("telefon_g", ""),
-                    "natel": row.get("natel", ""),
-                    "email_p": row.get("email_p", ""),
-                    "email_g": row.get("email_g", ""),
-                    "geburtsdatum": row.get("geburtsdatum", ""),
-                    "bemerkungen": row.get("bemerkungen", ""),
-                }
-                
-                # Validate required fields
-                if not customer_data["kunden_nr"] or not customer_data["vorname"] or not customer_data["name"]:
-                    errors.append(f"Zeile {row_num}: Pflichtfelder fehlen (kunden_nr, vorname, name)")
-                    continue
-                
-                customer_obj = Customer(**customer_data)
-                doc = customer_obj.model_dump()
-                doc["created_at"] = doc["created_at"].isoformat()
-                await db.customers.insert_one(doc)
-                imported_count += 1
-            except Exception as e:
-                errors.append(f"Zeile {row_num}: {str(e)}")
+        async for batch in iter_csv_batches(file, errors):
+            docs = []
+            line_nums = []
+            remarks = []
+            for row_num, row in batch:
+                try:
+                    customer_data = {
+                        "kunden_nr": row.get("kunden_nr", ""),
+                        "vorname": row.get("vorname", ""),
+                        "name": row.get("name", ""),
+                        "firma": row.get("firma", ""),
+                        "strasse": row.get("strasse", ""),
+                        "plz": row.get("plz", ""),
+                        "ort": row.get("ort", ""),
+                        "telefon_p": row.get("telefon_p", ""),
+                        "telefon_g": row.get("telefon_g", ""),
+                        "natel": row.get("natel", ""),
+                        "email_p": row.get("email_p", ""),
+                        "email_g": row.get("email_g", ""),
+                        "geburtsdatum": row.get("geburtsdatum", ""),
+                    }
+                    
+                    # Validate required fields
+                    if not customer_data["kunden_nr"] or not customer_data["vorname"] or not customer_data["name"]:
+                        errors.append(f"Zeile {row_num}: Pflichtfelder fehlen (kunden_nr, vorname, name)")
+                        continue
+                    
+                    customer_obj = Customer(**customer_data)
+                    doc = customer_obj.model_dump()
+                    doc["search_terms"] = customer_search_terms(doc)
+                    if row.get("bemerkungen"):
+                        remark = Remark(customer_id=doc["id"], text=row["bemerkungen"], timestamp=doc["created_at"].isoformat(), user=current_user["name"])
+                        remarks.append((len(docs), {**remark.model_dump(), "created_at": doc["created_at"]}))
+                    docs.append(doc)
+                    line_nums.append(row_num)
+                except Exception as e:
+                    errors.append(f"Zeile {row_num}: {str(e)}")
+            
+            failed = await insert_import_batch(db.customers, docs, line_nums, errors)
+            imported_count += len(docs) - len(failed)
+            remark_docs = [remark for position, remark in remarks if position not in failed]
+            if remark_docs:
+                await db.remarks.insert_many(remark_docs, ordered=False)
+            await bump_versions("customers", "remarks")
         
+        invalidate_stats_cache()
         return {
             "imported": imported_count,
             "errors": errors,
@@ -619,54 +1462,62 @@ async def upload_vehicles_csv(file: UploadFile = File(...), current_user: dict =
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
     try:
-        contents = await file.read()
-        csv_data = contents.decode('utf-8')
-        csv_reader = csv.DictReader(io.StringIO(csv_data))
-        
         imported_count = 0
         errors = []
         
-        for row_num, row in enumerate(csv_reader, start=2):
-            try:
-                # Find customer by kunden_nr
-                customer_nr = row.get("kunden_nr", "")
-                if not customer_nr:
-                    errors.append(f"Zeile {row_num}: kunden_nr fehlt")
-                    continue
-                
-                customer = await db.customers.find_one({"kunden_nr": customer_nr}, {"_id": 0})
-                if not customer:
-                    errors.append(f"Zeile {row_num}: Kunde mit Nr. {customer_nr} nicht gefunden")
-                    continue
-                
-                vehicle_data = {
-                    "customer_id": customer["id"],
-                    "marke": row.get("marke", ""),
-                    "modell": row.get("modell", ""),
-                    "chassis_nr": row.get("chassis_nr", ""),
-                    "stamm_nr": row.get("stamm_nr", ""),
-                    "typenschein_nr": row.get("typenschein_nr", ""),
-                    "farbe": row.get("farbe", ""),
-                    "inverkehrsetzung": row.get("inverkehrsetzung", ""),
-                    "km_stand": row.get("km_stand", ""),
-                    "vista_nr": row.get("vista_nr", ""),
-                    "verkaeufer": row.get("verkaeufer", ""),
-                    "kundenberater": row.get("kundenberater", ""),
-                }
-                
-                # Validate required fields
-                if not vehicle_data["marke"] or not vehicle_data["modell"] or not vehicle_data["chassis_nr"]:
-                    errors.append(f"Zeile {row_num}: Pflichtfelder fehlen (marke, modell, chassis_nr)")
-                    continue
-                
-                vehicle_obj = Vehicle(**vehicle_data)
-                doc = vehicle_obj.model_dump()
-                doc["created_at"] = doc["created_at"].isoformat()
-                await db.vehicles.insert_one(doc)
-                imported_count += 1
-            except Exception as e:
-                errors.append(f"Zeile {row_num}: {str(e)}")
+        async for batch in iter_csv_batches(file, errors):
+            # Resolve all kunden_nr of the batch with one query
+            kunden_nrs = list({row.get("kunden_nr", "") for _, row in batch} - {""})
+            customer_ids = {}
+            async for customer in db.customers.find({"kunden_nr": {"$in": kunden_nrs}}, {"_id": 0, "id": 1, "kunden_nr": 1}):
+                customer_ids.setdefault(customer["kunden_nr"], customer["id"])
+            
+            docs = []
+            line_nums = []
+            for row_num, row in batch:
+                try:
+                    # Find customer by kunden_nr
+                    customer_nr = row.get("kunden_nr", "")
+                    if not customer_nr:
+                        errors.append(f"Zeile {row_num}: kunden_nr fehlt")
+                        continue
+                    
+                    if customer_nr not in customer_ids:
+                        errors.append(f"Zeile {row_num}: Kunde mit Nr. {customer_nr} nicht gefunden")
+                        continue
+                    
+                    vehicle_data = {
+                        "customer_id": customer_ids[customer_nr],
+                        "marke": row.get("marke", ""),
+                        "modell": row.get("modell", ""),
+                        "chassis_nr": row.get("chassis_nr", ""),
+                        "stamm_nr": row.get("stamm_nr", ""),
+                        "typenschein_nr": row.get("typenschein_nr", ""),
+                        "farbe": row.get("farbe", ""),
+                        "inverkehrsetzung": row.get("inverkehrsetzung", ""),
+                        "km_stand": row.get("km_stand", ""),
+                        "vista_nr": row.get("vista_nr", ""),
+                        "verkaeufer": row.get("verkaeufer", ""),
+                        "kundenberater": row.get("kundenberater", ""),
+                    }
+                    
+                    # Validate required fields
+                    if not vehicle_data["marke"] or not vehicle_data["modell"] or not vehicle_data["chassis_nr"]:
+                        errors.append(f"Zeile {row_num}: Pflichtfelder fehlen (marke, modell, chassis_nr)")
+                        continue
+                    
+                    vehicle_obj = Vehicle(**vehicle_data)
+                    doc = store_dates(vehicle_obj.model_dump())
+                    docs.append(doc)
+                    line_nums.append(row_num)
+                except Exception as e:
+                    errors.append(f"Zeile {row_num}: {str(e)}")
+            
+            failed = await insert_import_batch(db.vehicles, docs, line_nums, errors)
+            imported_count += len(docs) - len(failed)
+            await bump_versions("vehicles")
         
+        invalidate_stats_cache()
         return {
             "imported": imported_count,
             "errors": errors,
@@ -675,45 +1526,46 @@ async def upload_vehicles_csv(file: UploadFile = File(...), current_user: dict =
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Fehler beim Verarbeiten der CSV: {str(e)}")
 
-
 # Employee routes
 @api_router.post("/employees", response_model=Employee)
 async def create_employee(employee_data: EmployeeCreate, current_user: dict = Depends(get_current_user)):
     employee_obj = Employee(**employee_data.model_dump())
-    doc = employee_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
+    doc = store_dates(employee_obj.model_dump())
     await db.employees.insert_one(doc)
+    await bump_versions("employees")
+    invalidate_stats_cache()
     return employee_obj
 
 @api_router.get("/employees", response_model=List[Employee])
-async def get_employees(current_user: dict = Depends(get_current_user)):
-    employees = await db.employees.find({}, {"_id": 0}).to_list(1000)
-    for employee in employees:
-        if isinstance(employee["created_at"], str):
-            employee["created_at"] = datetime.fromisoformat(employee["created_at"])
+async def get_employees(request: Request, response: Response, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    if cached := await not_modified(request, response, "employees"):
+        return cached
+    employees = await paginate(db.employees, {}, {"_id": 0}, limit, after, response)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(employees, response, ("eintritt_firma", "geburtstag"))
     return employees
 
 @api_router.get("/employees/{employee_id}", response_model=Employee)
-async def get_employee(employee_id: str, current_user: dict = Depends(get_current_user)):
+async def get_employee(employee_id: str, request: Request, response: Response, current_user: dict = Depends(get_current_user)):
+    if cached := await not_modified(request, response, "employees"):
+        return cached
     employee = await db.employees.find_one({"id": employee_id}, {"_id": 0})
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
-    if isinstance(employee["created_at"], str):
-        employee["created_at"] = datetime.fromisoformat(employee["created_at"])
     return employee
 
 @api_router.put("/employees/{employee_id}", response_model=Employee)
 async def update_employee(employee_id: str, employee_data: EmployeeCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.employees.find_one({"id": employee_id})
-    if not existing:
+    update_data = store_dates(employee_data.model_dump())
+    updated = await db.employees.find_one_and_update(
+        {"id": employee_id},
+        {"$set": update_data},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
         raise HTTPException(status_code=404, detail="Employee not found")
-    
-    update_data = employee_data.model_dump()
-    await db.employees.update_one({"id": employee_id}, {"$set": update_data})
-    
-    updated = await db.employees.find_one({"id": employee_id}, {"_id": 0})
-    if isinstance(updated["created_at"], str):
-        updated["created_at"] = datetime.fromisoformat(updated["created_at"])
+    await bump_versions("employees")
     return updated
 
 @api_router.delete("/employees/{employee_id}")
@@ -721,6 +1573,8 @@ async def delete_employee(employee_id: str, current_user: dict = Depends(get_cur
     result = await db.employees.delete_one({"id": employee_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Employee not found")
+    await bump_versions("employees")
+    invalidate_stats_cache()
     return {"message": "Employee deleted"}
 
 # Task routes
@@ -729,62 +1583,374 @@ async def create_task(task_data: TaskCreate, current_user: dict = Depends(get_cu
     task_dict = task_data.model_dump()
     task_dict["created_by"] = current_user["id"]
     task_obj = Task(**task_dict)
-    doc = task_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
+    doc = store_dates(task_obj.model_dump())
     await db.tasks.insert_one(doc)
+    await bump_versions("tasks")
+    invalidate_stats_cache()
+    notify_change("task", "created", doc)
     return task_obj
 
 @api_router.get("/tasks", response_model=List[Task])
-async def get_tasks(assigned_to: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+async def get_tasks(response: Response, assigned_to: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
     query = {}
     if assigned_to:
         query["assigned_to"] = assigned_to
-    tasks = await db.tasks.find(query, {"_id": 0}).to_list(1000)
-    for task in tasks:
-        if isinstance(task["created_at"], str):
-            task["created_at"] = datetime.fromisoformat(task["created_at"])
+    tasks = await paginate(db.tasks, query, {"_id": 0}, limit, after, response)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(tasks, response, ("datum_kontakt",))
     return tasks
 
-@api_router.get("/tasks/my")
-async def get_my_tasks(current_user: dict = Depends(get_current_user)):
-    tasks = await db.tasks.find({"assigned_to": current_user["id"]}, {"_id": 0}).to_list(1000)
-    for task in tasks:
-        if isinstance(task["created_at"], str):
-            task["created_at"] = datetime.fromisoformat(task["created_at"])
+@api_router.get("/tasks/my", response_model=List[Task])
+async def get_my_tasks(response: Response, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    tasks = await paginate(db.tasks, {"assigned_to": current_user["id"]}, {"_id": 0}, limit, after, response)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(tasks, response, ("datum_kontakt",))
     return tasks
 
 @api_router.put("/tasks/{task_id}/status")
 async def update_task_status(task_id: str, status: str, current_user: dict = Depends(get_current_user)):
-    existing = await db.tasks.find_one({"id": task_id})
-    if not existing:
+    task = await db.tasks.find_one_and_update(
+        {"id": task_id},
+        {"$set": {"status": status}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    await db.tasks.update_one({"id": task_id}, {"$set": {"status": status}})
+    await bump_versions("tasks")
+    invalidate_stats_cache()
+    notify_change("task", "updated", task)
     return {"message": "Task status updated"}
 
 @api_router.delete("/tasks/{task_id}")
 async def delete_task(task_id: str, current_user: dict = Depends(get_current_user)):
-    result = await db.tasks.delete_one({"id": task_id})
-    if result.deleted_count == 0:
+    task = await db.tasks.find_one_and_delete({"id": task_id}, projection={"_id": 0})
+    if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    await bump_versions("tasks")
+    invalidate_stats_cache()
+    notify_change("task", "deleted", task)
     return {"message": "Task deleted"}
 
 
+# Live event routes
+@api_router.post("/events/ticket")
+async def create_event_ticket(current_user: dict = Depends(get_current_user)):
+    ticket = create_access_token({"sub": current_user["id"], "scope": EVENT_TICKET_SCOPE}, timedelta(seconds=EVENT_TICKET_EXPIRE_SECONDS))
+    return {"ticket": ticket}
+
+@api_router.get("/events")
+async def stream_events(request: Request, ticket: str = Query(...)):
+    # EventSource cannot send an Authorization header, so a short-lived ticket comes as query parameter
+    # and the access token stays out of access logs
+    await user_from_token(ticket, EVENT_TICKET_SCOPE)
+    queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    event_subscribers.add(queue)
+    
+    async def body():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), EVENT_HEARTBEAT)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {orjson.dumps(event).decode()}\n\n"
+        finally:
+            event_subscribers.discard(queue)
+    
+    return StreamingResponse(body(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+# Dashboard routes
+@api_router.get("/dashboard/stats")
+async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
+    now = time.monotonic()
+    if stats_cache["expires"] <= now:
+        customers, vehicles, employees, open_tasks = await asyncio.gather(
+            db.customers.estimated_document_count(),
+            db.vehicles.estimated_document_count(),
+            db.employees.estimated_document_count(),
+            db.tasks.aggregate([
+                {"$match": {"status": "offen"}},
+                {"$group": {"_id": "$assigned_to", "count": {"$sum": 1}}},
+            ]).to_list(None),
+        )
+        stats_cache.update(
+            expires=now + STATS_CACHE_TTL,
+            customers=customers,
+            vehicles=vehicles,
+            employees=employees,
+            open_tasks={row["_id"]: row["count"] for row in open_tasks},
+        )
+    
+    return {
+        "customers": stats_cache["customers"],
+        "vehicles": stats_cache["vehicles"],
+        "employees": stats_cache["employees"],
+        "tasks": stats_cache["open_tasks"].get(current_user["id"], 0),
+    }
+
+# Image derivatives
+def get_image_executor() -> ProcessPoolExecutor:
+    global image_executor
+    if image_executor is None:
+        image_executor = ProcessPoolExecutor(max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return image_executor
+
+def is_image_upload(filename: str) -> bool:
+    return Path(filename).suffix.lower() in IMAGE_EXTENSIONS
+
+async def render_variant(filename: str, variant: str) -> Path:
+    global image_executor
+    target = DERIVATIVE_DIR / f"{Path(filename).stem}_{variant}.webp"
+    if not target.exists():
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                get_image_executor(), render_derivative, str(UPLOAD_DIR / filename), str(target), IMAGE_VARIANTS[variant]
+            )
+        except BrokenProcessPool:
+            # A crashed worker poisons the pool; start a fresh one on next use
+            image_executor = None
+            raise
+    return target
+
+async def generate_derivatives(filename: str):
+    for variant in IMAGE_VARIANTS:
+        try:
+            await render_variant(filename, variant)
+        except Exception as e:
+            logger.warning(f"Could not render {variant} for {filename}: {e}")
+
+# Public like the /uploads mount, so <img> tags can load it without a token
+@api_router.get("/uploads/{filename}/{variant}")
+async def get_upload_variant(filename: str, variant: str, request: Request):
+    if variant not in IMAGE_VARIANTS:
+        raise HTTPException(status_code=404, detail="Unknown variant")
+    if Path(filename).name != filename or not is_image_upload(filename) or not (UPLOAD_DIR / filename).is_file():
+        raise HTTPException(status_code=404, detail="Image not found")
+    
+    # Upload names never change content, so variants are immutable
+    etag = f'"{Path(filename).stem}-{variant}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=31536000, immutable"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match == "*" or etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    
+    try:
+        target = await render_variant(filename, variant)
+    except Exception:
+        raise HTTPException(status_code=415, detail="Unsupported image")
+    return FileResponse(target, media_type="image/webp", headers=headers)
+
 # File Upload route
+UPLOAD_PATH = "/api/upload"
+# Multipart framing around the file (boundaries, part headers)
+UPLOAD_BODY_OVERHEAD = 64 * 1024
+
+def upload_too_large() -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File exceeds {MAX_UPLOAD_SIZE // (1024 * 1024)} MB limit")
+
+class UploadSizeLimitMiddleware:
+    # Starlette spools the whole multipart body before the route runs, so oversized uploads are cut off here
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != UPLOAD_PATH:
+            await self.app(scope, receive, send)
+            return
+        limit = MAX_UPLOAD_SIZE + UPLOAD_BODY_OVERHEAD
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit:
+            response = JSONResponse({"detail": upload_too_large().detail}, status_code=413, headers={"Connection": "close"})
+            await response(scope, receive, send)
+            return
+        received = 0
+
+        async def limited_receive():
+            # Chunked bodies carry no Content-Length; FastAPI passes an HTTPException from body parsing through
+            nonlocal received
+            message = await receive()
+            received += len(message.get("body", b""))
+            if received > limit:
+                raise upload_too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+async def store_upload(file: UploadFile) -> tuple:
+    # Streams to a temp file in chunks, hashing on the way; returns (sha256, size, temp_path)
+    temp_path = UPLOAD_DIR / f".{uuid.uuid4()}.part"
+    sha256 = hashlib.sha256()
+    size = 0
+    buffer = await run_in_threadpool(open, temp_path, "wb")
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_UPLOAD_SIZE:
+                raise upload_too_large()
+            sha256.update(chunk)
+            await run_in_threadpool(buffer.write, chunk)
+    except BaseException:
+        await run_in_threadpool(buffer.close)
+        temp_path.unlink(missing_ok=True)
+        raise
+    await run_in_threadpool(buffer.close)
+    return sha256.hexdigest(), size, temp_path
+
 @api_router.post("/upload")
-async def upload_file(file: UploadFile = File(...), current_user: dict = Depends(get_current_user)):
+async def upload_file(background_tasks: BackgroundTasks, file: UploadFile = File(...), current_user: dict = Depends(get_current_user)):
     try:
-        file_ext = Path(file.filename).suffix
-        unique_filename = f"{uuid.uuid4()}{file_ext}"
+        digest, size, temp_path = await store_upload(file)
+        
+        # Content-addressed: identical files are stored once; scripts/cleanup_uploads.py collects unreferenced ones
+        file_ext = Path(file.filename).suffix.lower()
+        unique_filename = f"{digest}{file_ext}"
         file_path = UPLOAD_DIR / unique_filename
+        if file_path.exists():
+            temp_path.unlink()
+            # Restart the grace period, a new form may be about to reference an orphaned file
+            os.utime(file_path)
+        else:
+            os.replace(temp_path, file_path)
         
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await db.uploads.update_one(
+            {"filename": unique_filename},
+            {
+                "$setOnInsert": {
+                    "sha256": digest,
+                    "size": size,
+                    "content_type": file.content_type,
+                    "created_at": datetime.now(timezone.utc),
+                    "created_by": current_user["id"],
+                },
+            },
+            upsert=True
+        )
+        if is_image_upload(unique_filename):
+            background_tasks.add_task(generate_derivatives, unique_filename)
         
         return {"filename": unique_filename, "path": f"/uploads/{unique_filename}"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+# Orphaned upload collection
+def scan_directory(directory: Path) -> list:
+    with os.scandir(directory) as entries:
+        return [
+            (entry.name, stat.st_size, stat.st_mtime)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False) and (stat := entry.stat(follow_symlinks=False))
+        ]
+
+def field_values(value, path: list) -> list:
+    # Resolves a dotted path through nested arrays like a Mongo query does
+    if isinstance(value, list):
+        return [found for item in value for found in field_values(item, path)]
+    if not path:
+        return [value]
+    return field_values(value.get(path[0]), path[1:]) if isinstance(value, dict) else []
+
+async def upload_sources() -> dict:
+    sources = dict(UPLOAD_REFERENCES)
+    if not await db.migrations.find_one({"_id": "0001_customer_notes", "status": "done"}, {"_id": 1}):
+        sources.update(LEGACY_UPLOAD_REFERENCES)
+    return sources
+
+async def referenced_uploads(sources: dict) -> dict:
+    # filename -> collections referencing it; a set of names stays small even for large collections
+    references = {}
+    for collection_name, fields in sources.items():
+        query = {"$or": [{field: {"$gt": ""}} for field in fields]}
+        projection = {"_id": 0, **{field: 1 for field in fields}}
+        async for doc in db[collection_name].find(query, projection).batch_size(EXPORT_BATCH_SIZE):
+            for field in fields:
+                for filename in field_values(doc, field.split(".")):
+                    if filename:
+                        references.setdefault(filename, set()).add(collection_name)
+    return references
+
+def remove_files(paths: list) -> list:
+    removed = []
+    for path in paths:
+        try:
+            path.unlink()
+            removed.append(path.name)
+        except FileNotFoundError:
+            pass
+    return removed
+
+async def collect_uploads(delete: bool = False, grace_hours: float = UPLOAD_GC_GRACE_HOURS) -> dict:
+    # Scan before reading references: a file uploaded in between is younger than the grace period
+    files = await run_in_threadpool(scan_directory, UPLOAD_DIR)
+    derivatives = await run_in_threadpool(scan_directory, DERIVATIVE_DIR)
+    sources = await upload_sources()
+    references = await referenced_uploads(sources)
+    cutoff = time.time() - grace_hours * 3600
+
+    usage = {collection_name: {"files": 0, "bytes": 0} for collection_name in sources}
+    unreferenced = {"files": 0, "bytes": 0}
+    orphans = []
+    kept = set()
+    for name, size, mtime in files:
+        for collection_name in references.get(name, ()):
+            usage[collection_name]["files"] += 1
+            usage[collection_name]["bytes"] += size
+        if name in references:
+            kept.add(Path(name).stem)
+            continue
+        # Includes .part leftovers of aborted uploads
+        unreferenced["files"] += 1
+        unreferenced["bytes"] += size
+        if mtime < cutoff:
+            orphans.append((name, size))
+        else:
+            kept.add(Path(name).stem)
+    stale_derivatives = [
+        (name, size) for name, size, mtime in derivatives
+        if name.rsplit("_", 1)[0] not in kept and mtime < cutoff
+    ]
+
+    removed = []
+    if delete and (orphans or stale_derivatives):
+        removed = await run_in_threadpool(remove_files, [UPLOAD_DIR / name for name, _ in orphans])
+        await run_in_threadpool(remove_files, [DERIVATIVE_DIR / name for name, _ in stale_derivatives])
+        for start in range(0, len(removed), EXPORT_BATCH_SIZE):
+            await db.uploads.delete_many({"filename": {"$in": removed[start:start + EXPORT_BATCH_SIZE]}})
+
+    present = {name for name, _, _ in files}
+    missing = sorted(name for name in references if name not in present)
+    return {
+        "grace_hours": grace_hours,
+        "deleted": delete,
+        "total": {"files": len(files), "bytes": sum(size for _, size, _ in files)},
+        "usage": usage,
+        "derivatives": {"files": len(derivatives), "bytes": sum(size for _, size, _ in derivatives)},
+        "unreferenced": unreferenced,
+        "orphans": {
+            "files": len(orphans),
+            "bytes": sum(size for _, size in orphans),
+            "removed": len(removed),
+            "filenames": [name for name, _ in orphans[:UPLOAD_GC_REPORT_LIMIT]],
+        },
+        "stale_derivatives": {"files": len(stale_derivatives), "bytes": sum(size for _, size in stale_derivatives)},
+        "missing": {"files": len(missing), "filenames": missing[:UPLOAD_GC_REPORT_LIMIT]},
+    }
+
+@api_router.get("/admin/uploads/usage")
+async def get_upload_usage(grace_hours: float = Query(UPLOAD_GC_GRACE_HOURS, ge=1), admin: dict = Depends(get_admin_user)):
+    return await collect_uploads(delete=False, grace_hours=grace_hours)
+
+@api_router.post("/admin/uploads/cleanup")
+async def cleanup_uploads(grace_hours: float = Query(UPLOAD_GC_GRACE_HOURS, ge=1), admin: dict = Depends(get_admin_user)):
+    report = await collect_uploads(delete=True, grace_hours=grace_hours)
+    logger.info(f"Removed {report['orphans']['removed']} orphaned uploads ({report['orphans']['bytes']} bytes)")
+    return report
+
 # Client Experience routes
 @api_router.post("/client-experience", response_model=ClientExperience)
 async def create_client_experience(ce_data: ClientExperienceCreate, current_user: dict = Depends(get_current_user)):
@@ -792,16 +1958,19 @@ async def create_client_experience(ce_data: ClientExperienceCreate, current_user
     ce_dict["created_by"] = current_user["name"]
     ce_obj = ClientExperience(**ce_dict)
     doc = ce_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
     await db.client_experiences.insert_one(doc)
+    await bump_versions("client_experiences")
+    notify_change("client_experience", "created", doc)
     return ce_obj
 
 @api_router.get("/client-experience", response_model=List[ClientExperience])
-async def get_client_experiences(current_user: dict = Depends(get_current_user)):
-    experiences = await db.client_experiences.find({}, {"_id": 0}).to_list(1000)
-    for exp in experiences:
-        if isinstance(exp["created_at"], str):
-            exp["created_at"] = datetime.fromisoformat(exp["created_at"])
+async def get_client_experiences(response: Response, view: ListView = "full", limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    if view == "summary":
+        experiences = await paginate(db.client_experiences, {}, view_projection(ClientExperienceSummary), limit, after, response)
+        return view_response(experiences, ClientExperienceSummary, response)
+    experiences = await paginate(db.client_experiences, {}, {"_id": 0}, limit, after, response)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(experiences, response)
     return experiences
 
 @api_router.get("/client-experience/{ce_id}", response_model=ClientExperience)
@@ -809,47 +1978,51 @@ async def get_client_experience(ce_id: str, current_user: dict = Depends(get_cur
     experience = await db.client_experiences.find_one({"id": ce_id}, {"_id": 0})
     if not experience:
         raise HTTPException(status_code=404, detail="Client Experience not found")
-    if isinstance(experience["created_at"], str):
-        experience["created_at"] = datetime.fromisoformat(experience["created_at"])
     return experience
 
 @api_router.post("/client-experience/{ce_id}/action")
 async def add_action(ce_id: str, action_data: ActionCreate, current_user: dict = Depends(get_current_user)):
-    experience = await db.client_experiences.find_one({"id": ce_id})
-    if not experience:
-        raise HTTPException(status_code=404, detail="Client Experience not found")
-    
     new_action = {
         "text": action_data.text,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "user": current_user["name"]
     }
     
-    await db.client_experiences.update_one(
+    experience = await db.client_experiences.find_one_and_update(
         {"id": ce_id},
-        {"$push": {"aktionen": new_action}}
+        {"$push": {"aktionen": new_action}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
+    if not experience:
+        raise HTTPException(status_code=404, detail="Client Experience not found")
+    await bump_versions("client_experiences")
+    notify_change("client_experience", "updated", experience)
     
     return {"message": "Action added", "action": new_action}
 
 @api_router.put("/client-experience/{ce_id}/status")
 async def update_ce_status(ce_id: str, status: str, current_user: dict = Depends(get_current_user)):
-    experience = await db.client_experiences.find_one({"id": ce_id})
-    if not experience:
-        raise HTTPException(status_code=404, detail="Client Experience not found")
-    
-    await db.client_experiences.update_one(
+    experience = await db.client_experiences.find_one_and_update(
         {"id": ce_id},
-        {"$set": {"status": status}}
+        {"$set": {"status": status}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
+    if not experience:
+        raise HTTPException(status_code=404, detail="Client Experience not found")
+    await bump_versions("client_experiences")
+    notify_change("client_experience", "updated", experience)
     
     return {"message": "Status updated"}
 
 @api_router.delete("/client-experience/{ce_id}")
 async def delete_client_experience(ce_id: str, current_user: dict = Depends(get_current_user)):
-    result = await db.client_experiences.delete_one({"id": ce_id})
-    if result.deleted_count == 0:
+    experience = await db.client_experiences.find_one_and_delete({"id": ce_id}, projection={"_id": 0})
+    if not experience:
         raise HTTPException(status_code=404, detail="Client Experience not found")
+    await bump_versions("client_experiences")
+    notify_change("client_experience", "deleted", experience)
     return {"message": "Client Experience deleted"}
 
 
@@ -860,16 +2033,19 @@ async def create_kaufvertrag(kv_data: KaufvertragCreate, current_user: dict = De
     kv_dict["created_by"] = current_user["name"]
     kv_obj = Kaufvertrag(**kv_dict)
     doc = kv_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
     await db.kaufvertraege.insert_one(doc)
+    await bump_versions("kaufvertraege")
     return kv_obj
 
 @api_router.get("/kaufvertraege", response_model=List[Kaufvertrag])
-async def get_kaufvertraege(current_user: dict = Depends(get_current_user)):
-    vertraege = await db.kaufvertraege.find({}, {"_id": 0}).to_list(1000)
-    for vertrag in vertraege:
-        if isinstance(vertrag["created_at"], str):
-            vertrag["created_at"] = datetime.fromisoformat(vertrag["created_at"])
+async def get_kaufvertraege(response: Response, view: ListView = "full", created_from: Optional[datetime] = None, created_to: Optional[datetime] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), after: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    query = created_range(created_from, created_to)
+    if view == "summary":
+        vertraege = await paginate(db.kaufvertraege, query, view_projection(KaufvertragSummary), limit, after, response)
+        return view_response(vertraege, KaufvertragSummary, response)
+    vertraege = await paginate(db.kaufvertraege, query, {"_id": 0}, limit, after, response)
+    if FAST_JSON_RESPONSES:
+        return fast_json_response(vertraege, response)
     return vertraege
 
 @api_router.get("/kaufvertraege/{kv_id}", response_model=Kaufvertrag)
@@ -877,8 +2053,6 @@ async def get_kaufvertrag(kv_id: str, current_user: dict = Depends(get_current_u
     vertrag = await db.kaufvertraege.find_one({"id": kv_id}, {"_id": 0})
     if not vertrag:
         raise HTTPException(status_code=404, detail="Kaufvertrag not found")
-    if isinstance(vertrag["created_at"], str):
-        vertrag["created_at"] = datetime.fromisoformat(vertrag["created_at"])
     return vertrag
 
 @api_router.delete("/kaufvertraege/{kv_id}")
@@ -886,6 +2060,7 @@ async def delete_kaufvertrag(kv_id: str, current_user: dict = Depends(get_curren
     result = await db.kaufvertraege.delete_one({"id": kv_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Kaufvertrag not found")
+    await bump_versions("kaufvertraege")
     return {"message": "Kaufvertrag deleted"}
 
 
@@ -897,14 +2072,20 @@ app.include_router(api_router)
 # Mount uploads directory for static files
 app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
 
+# Inside CORS, so browsers can read the 413
+app.add_middleware(UploadSizeLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+app.add_middleware(MetricsMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -912,6 +2093,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Required indexes per collection: (keys, options)
+INDEXES = {
+    "users": [
+        ([("id", 1)], {"unique": True}),
+        ([("username", 1)], {"unique": True}),
+        (PAGINATION_SORT, {}),
+    ],
+    "customers": [
+        ([("id", 1)], {"unique": True}),
+        ([("kunden_nr", 1)], {}),
+        ([("search_terms", 1)], {}),
+        (PAGINATION_SORT, {}),
+        ([("name", 1), ("id", 1)], {}),
+    ],
+    "remarks": [
+        ([("id", 1)], {"unique": True}),
+        ([("customer_id", 1)] + PAGINATION_SORT, {}),
+    ],
+    "correspondence": [
+        ([("id", 1)], {"unique": True}),
+        ([("customer_id", 1)] + PAGINATION_SORT, {}),
+    ],
+    "vehicles": [
+        ([("id", 1)], {"unique": True}),
+        ([("customer_id", 1)] + PAGINATION_SORT, {}),
+        (PAGINATION_SORT, {}),
+    ],
+    "employees": [
+        ([("id", 1)], {"unique": True}),
+        (PAGINATION_SORT, {}),
+    ],
+    "tasks": [
+        ([("id", 1)], {"unique": True}),
+        ([("assigned_to", 1)] + PAGINATION_SORT, {}),
+        ([("customer_id", 1)], {}),
+        ([("status", 1), ("assigned_to", 1)], {}),
+        (PAGINATION_SORT, {}),
+    ],
+    "client_experiences": [
+        ([("id", 1)], {"unique": True}),
+        ([("customer_id", 1)], {}),
+        (PAGINATION_SORT, {}),
+    ],
+    "uploads": [
+        ([("filename", 1)], {"unique": True}),
+    ],
+    "kaufvertraege": [
+        ([("id", 1)], {"unique": True}),
+        ([("kunde_name", 1), ("kunde_vorname", 1)], {}),
+        (PAGINATION_SORT, {}),
+    ],
+}
+
+def index_name(keys: list) -> str:
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+@app.on_event("startup")
+async def ensure_indexes():
+    for collection_name, indexes in INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        for keys, options in indexes:
+            name = index_name(keys)
+            current = existing.get(name)
+            if current is not None:
+                if [tuple(k) for k in current["key"]] != keys or current.get("unique", False) != options.get("unique", False):
+                    logger.warning(f"Index {collection_name}.{name} diverges from spec: {current} (expected {keys}, {options})")
+                continue
+            logger.info(f"Creating missing index {collection_name}.{name}")
+            try:
+                await collection.create_index(keys, name=name, **options)
+            except OperationFailure as e:
+                logger.error(f"Could not create index {collection_name}.{name}: {e}")
+
+@app.on_event("startup")
+async def capture_event_loop():
+    # Slow-query explains are scheduled from pymongo's threads onto this loop
+    slow_query_state["loop"] = asyncio.get_running_loop()
+
+@app.on_event("startup")
+async def start_change_stream():
+    if EVENT_CHANGE_STREAM:
+        event_source["watcher"] = asyncio.create_task(watch_changes())
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if event_source["watcher"] is not None:
+        event_source["watcher"].cancel()
     client.close()
+    password_executor.shutdown(wait=False)
+    if image_executor is not None:
+        image_executor.shutdown(wait=False)
@@ -0,0 +1,85 @@
+import { useEffect, useState } from "react";
+import axios from "axios";
+import { Button } from "@/components/ui/button";
+import { Input } from "@/components/ui/input";
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+const RESULT_LIMIT = 20;
+
+// Picks a customer through the search endpoint, so no page has to load every customer
+export default function CustomerSelect({ onSelect, testId }) {
+  const [query, setQuery] = useState("");
+  const [results, setResults] = useState([]);
+  const [selected, setSelected] = useState(null);
+
+  useEffect(() => {
+    if (!query.trim()) {
+      setResults([]);
+      return undefined;
+    }
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      const token = localStorage.getItem("token");
+      try {
+        const response = await axios.get(`${API}/customers/search`, {
+          headers: { Authorization: `Bearer ${token}` },
+          params: { q: query, limit: RESULT_LIMIT },
+        });
+        if (!cancelled) {
+          setResults(response.data);
+        }
+      } catch (error) {
+        console.error("Error searching customers:", error);
+      }
+    }, 250);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [query]);
+
+  const choose = (customer) => {
+    setSelected(customer);
+    setQuery("");
+    onSelect(customer);
+  };
+
+  if (selected) {
+    return (
+      <div className="flex items-center justify-between rounded-md border px-3 py-2" data-testid={testId}>
+        <span>
+          {selected.vorname} {selected.name} (Nr: {selected.kunden_nr})
+        </span>
+        <Button type="button" variant="ghost" size="sm" onClick={() => setSelected(null)}>
+          Ändern
+        </Button>
+      </div>
+    );
+  }
+
+  return (
+    <div className="space-y-1" data-testid={testId}>
+      <Input
+        placeholder="Kunde suchen (Name, Firma oder Kunden-Nr)"
+        value={query}
+        onChange={(e) => setQuery(e.target.value)}
+        data-testid={testId && `${testId}-input`}
+      />
+      {results.length > 0 && (
+        <div className="max-h-60 overflow-y-auto rounded-md border">
+          {results.map((customer) => (
+            <button
+              key={customer.id}
+              type="button"
+              onClick={() => choose(customer)}
+              className="block w-full px-3 py-2 text-left text-sm hover:bg-gray-100"
+            >
+              {customer.vorname} {customer.name} (Nr: {customer.kunden_nr})
+            </button>
+          ))}
+        </div>
+      )}
+    </div>
+  );
+}
@@ -0,0 +1,14 @@
+import { Button } from "@/components/ui/button";
+
+export default function LoadMore({ hasMore, loading, onLoadMore, testId = "load-more-button" }) {
+  if (!hasMore) {
+    return null;
+  }
+  return (
+    <div className="flex justify-center py-4">
+      <Button variant="outline" onClick={onLoadMore} disabled={loading} data-testid={testId}>
+        {loading ? "Laden..." : "Weitere laden"}
+      </Button>
+    </div>
+  );
+}
@@ -0,0 +1,71 @@
+import { useEffect, useRef } from "react";
+import axios from "axios";
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+const RECONNECT_DELAY = 5000;
+
+// Applies a created/updated/deleted event to a list of records keyed by id
+export function applyLiveEvent(items, { action, data }) {
+  const rest = items.filter((item) => item.id !== data.id);
+  if (action === "deleted") {
+    return rest;
+  }
+  if (action === "created") {
+    return [...rest, data];
+  }
+  return items.map((item) => (item.id === data.id ? { ...item, ...data } : item));
+}
+
+// Subscribes to the server-sent event stream for one event type
+export function useLiveEvents(type, onEvent) {
+  const handler = useRef(onEvent);
+  handler.current = onEvent;
+
+  useEffect(() => {
+    let source = null;
+    let retry = null;
+    let closed = false;
+    const listener = (event) => handler.current(JSON.parse(event.data));
+    const reconnect = () => {
+      retry = setTimeout(connect, RECONNECT_DELAY);
+    };
+
+    // The stream is opened with a ticket that expires after a minute, so every reconnect fetches a new one
+    const connect = async () => {
+      const token = localStorage.getItem("token");
+      if (!token) {
+        return;
+      }
+      try {
+        const response = await axios.post(`${API}/events/ticket`, null, {
+          headers: { Authorization: `Bearer ${token}` },
+        });
+        if (closed) {
+          return;
+        }
+        source = new EventSource(`${API}/events?ticket=${encodeURIComponent(response.data.ticket)}`);
+        source.addEventListener(type, listener);
+        source.onerror = () => {
+          source.close();
+          reconnect();
+        };
+      } catch (error) {
+        console.error("Error fetching event ticket:", error);
+        // A rejected access token needs a new login, not another attempt
+        if (!closed && error.response?.status !== 401) {
+          reconnect();
+        }
+      }
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retry);
+      if (source) {
+        source.close();
+      }
+    };
+  }, [type]);
+}
@@ -0,0 +1,60 @@
+import { useCallback, useEffect, useRef, useState } from "react";
+import axios from "axios";
+import { toast } from "sonner";
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+
+// Loads a keyset-paginated list page by page, following the X-Next-Cursor header
+export function usePaginatedList(path, { params, errorMessage } = {}) {
+  const [items, setItems] = useState([]);
+  const [cursor, setCursor] = useState(null);
+  const [loading, setLoading] = useState(false);
+  const latestRequest = useRef(0);
+  const paramsKey = JSON.stringify(params || {});
+
+  const fetchPage = useCallback(
+    async (after) => {
+      const token = localStorage.getItem("token");
+      const request = ++latestRequest.current;
+      setLoading(true);
+      if (!after) {
+        // The old cursor belongs to the previous path or params
+        setCursor(null);
+      }
+      try {
+        const response = await axios.get(`${API}${path}`, {
+          headers: { Authorization: `Bearer ${token}` },
+          params: after ? { ...JSON.parse(paramsKey), after } : JSON.parse(paramsKey),
+        });
+        // A reload started meanwhile wins over an older page
+        if (request !== latestRequest.current) return;
+        setItems((current) => (after ? [...current, ...response.data] : response.data));
+        setCursor(response.headers["x-next-cursor"] || null);
+      } catch (error) {
+        console.error(`Error fetching ${path}:`, error);
+        if (errorMessage) {
+          toast.error(errorMessage);
+        }
+      } finally {
+        if (request === latestRequest.current) {
+          setLoading(false);
+        }
+      }
+    },
+    [path, paramsKey, errorMessage]
+  );
+
+  const reload = useCallback(() => fetchPage(null), [fetchPage]);
+  const loadMore = useCallback(() => {
+    if (cursor) {
+      fetchPage(cursor);
+    }
+  }, [cursor, fetchPage]);
+
+  useEffect(() => {
+    reload();
+  }, [reload]);
+
+  return { items, setItems, hasMore: Boolean(cursor), loading, reload, loadMore };
+}
@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useState } from "react";
 import Layout from "@/components/Layout";
 import axios from "axios";
 import { Button } from "@/components/ui/button";
@@ -8,16 +8,25 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from "@/components/ui/dialog";
 import { Badge } from "@/components/ui/badge";
 import { Label } from "@/components/ui/label";
-import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { toast } from "sonner";
+import CustomerSelect from "@/components/CustomerSelect";
+import LoadMore from "@/components/LoadMore";
+import { applyLiveEvent, useLiveEvents } from "@/hooks/use-live-events";
+import { usePaginatedList } from "@/hooks/use-paginated-list";
 import { Plus, Send, FileText, CheckCircle, XCircle } from "lucide-react";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 export default function ClientExperience({ user, onLogout }) {
-  const [cases, setCases] = useState([]);
-  const [customers, setCustomers] = useState([]);
+  const {
+    items: cases,
+    setItems: setCases,
+    hasMore,
+    loading,
+    reload: fetchCases,
+    loadMore,
+  } = usePaginatedList("/client-experience", { errorMessage: "Fehler beim Laden der Fälle" });
   const [dialogOpen, setDialogOpen] = useState(false);
   const [actionDialogOpen, setActionDialogOpen] = useState(false);
   const [selectedCase, setSelectedCase] = useState(null);
@@ -36,35 +45,7 @@ export default function ClientExperience({ user, onLogout }) {
     datei_upload: "",
   });
 
-  useEffect(() => {
-    fetchCases();
-    fetchCustomers();
-  }, []);
-
-  const fetchCases = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/client-experience`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setCases(response.data);
-    } catch (error) {
-      console.error("Error fetching cases:", error);
-      toast.error("Fehler beim Laden der Fälle");
-    }
-  };
-
-  const fetchCustomers = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/customers`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setCustomers(response.data);
-    } catch (error) {
-      console.error("Error fetching customers:", error);
-    }
-  };
+  useLiveEvents("client_experience", (event) => setCases((current) => applyLiveEvent(current, event)));
 
   const handleFileUpload = async (file) => {
     const token = localStorage.getItem("token");
@@ -88,6 +69,10 @@ export default function ClientExperience({ user, onLogout }) {
 
   const handleSubmit = async (e) => {
     e.preventDefault();
+    if (!manualCustomer && !formData.customer_id) {
+      toast.error("Bitte einen Kunden auswählen");
+      return;
+    }
     setUploading(true);
     const token = localStorage.getItem("token");
 
@@ -165,15 +150,12 @@ export default function ClientExperience({ user, onLogout }) {
     }
   };
 
-  const handleCustomerSelect = (customerId) => {
-    const customer = customers.find((c) => c.id === customerId);
-    if (customer) {
-      setFormData({
-        ...formData,
-        customer_id: customerId,
-        customer_name: `${customer.vorname} ${customer.name}`,
-      });
-    }
+  const handleCustomerSelect = (customer) => {
+    setFormData({
+      ...formData,
+      customer_id: customer.id,
+      customer_name: `${customer.vorname} ${customer.name}`,
+    });
   };
 
   const formatDateTime = (isoString) => {
@@ -240,18 +222,7 @@ export default function ClientExperience({ user, onLogout }) {
                   ) : (
                     <div>
                       <Label htmlFor="customer">Kunde auswählen*</Label>
-                      <Select onValueChange={handleCustomerSelect} required>
-                        <SelectTrigger data-testid="ce-customer-select">
-                          <SelectValue placeholder="Kunde auswählen" />
-                        </SelectTrigger>
-                        <SelectContent>
-                          {customers.map((customer) => (
-                            <SelectItem key={customer.id} value={customer.id}>
-                              {customer.vorname} {customer.name} (Nr: {customer.kunden_nr})
-                            </SelectItem>
-                          ))}
-                        </SelectContent>
-                      </Select>
+                      <CustomerSelect onSelect={handleCustomerSelect} testId="ce-customer-select" />
                     </div>
                   )}
                 </div>
@@ -428,6 +399,7 @@ export default function ClientExperience({ user, onLogout }) {
             <p className="text-lg">Keine Fälle vorhanden</p>
           </div>
         )}
+        <LoadMore hasMore={hasMore} loading={loading} onLoadMore={loadMore} />
       </div>
 
       {/* Add Action Dialog */}
@@ -21,6 +21,8 @@ export default function CustomerDetails({ user, onLogout }) {
   const [customer, setCustomer] = useState(null);
   const [vehicles, setVehicles] = useState([]);
   const [tasks, setTasks] = useState([]);
+  const [remarks, setRemarks] = useState([]);
+  const [correspondence, setCorrespondence] = useState([]);
   const [vehicleDialogOpen, setVehicleDialogOpen] = useState(false);
   const [editDialogOpen, setEditDialogOpen] = useState(false);
   const [remarkDialogOpen, setRemarkDialogOpen] = useState(false);
@@ -57,9 +59,7 @@ export default function CustomerDetails({ user, onLogout }) {
   const [uploading, setUploading] = useState(false);
 
   useEffect(() => {
-    fetchCustomer();
-    fetchVehicles();
-    fetchTasks();
+    fetchCustomerDetails();
   }, [id]);
 
   const formatDate = (dateString) => {
@@ -82,6 +82,24 @@ export default function CustomerDetails({ user, onLogout }) {
     return `${day}/${month}/${year} ${hours}:${minutes}`;
   };
 
+  const fetchCustomerDetails = async () => {
+    const token = localStorage.getItem("token");
+    try {
+      const response = await axios.get(`${API}/customers/${id}/full`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+      setCustomer(response.data.customer);
+      setEditFormData(response.data.customer);
+      setVehicles(response.data.vehicles);
+      setTasks(response.data.tasks);
+      setRemarks(response.data.remarks);
+      setCorrespondence(response.data.correspondence);
+    } catch (error) {
+      console.error("Error fetching customer:", error);
+      toast.error("Fehler beim Laden des Kunden");
+    }
+  };
+
   const fetchCustomer = async () => {
     const token = localStorage.getItem("token");
     try {
@@ -96,29 +114,39 @@ export default function CustomerDetails({ user, onLogout }) {
     }
   };
 
-  const fetchVehicles = async () => {
+  const fetchRemarks = async () => {
     const token = localStorage.getItem("token");
     try {
-      const response = await axios.get(`${API}/vehicles?customer_id=${id}`, {
+      const response = await axios.get(`${API}/customers/${id}/remarks?limit=1000`, {
         headers: { Authorization: `Bearer ${token}` },
       });
-      setVehicles(response.data);
+      setRemarks(response.data);
     } catch (error) {
-      console.error("Error fetching vehicles:", error);
+      console.error("Error fetching remarks:", error);
     }
   };
 
-  const fetchTasks = async () => {
+  const fetchCorrespondence = async () => {
     const token = localStorage.getItem("token");
     try {
-      const response = await axios.get(`${API}/tasks`, {
+      const response = await axios.get(`${API}/customers/${id}/correspondence?limit=1000`, {
         headers: { Authorization: `Bearer ${token}` },
       });
-      // Filter tasks for this customer
-      const customerTasks = response.data.filter(task => task.customer_id === id);
-      setTasks(customerTasks);
+      setCorrespondence(response.data);
     } catch (error) {
-      console.error("Error fetching tasks:", error);
+      console.error("Error fetching correspondence:", error);
+    }
+  };
+
+  const fetchVehicles = async () => {
+    const token = localStorage.getItem("token");
+    try {
+      const response = await axios.get(`${API}/vehicles?customer_id=${id}&limit=1000`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
+      setVehicles(response.data);
+    } catch (error) {
+      console.error("Error fetching vehicles:", error);
     }
   };
 
@@ -183,7 +211,7 @@ export default function CustomerDetails({ user, onLogout }) {
       toast.success("Bemerkung hinzugefügt!");
       setNewRemark("");
       setRemarkDialogOpen(false);
-      fetchCustomer();
+      fetchRemarks();
     } catch (error) {
       console.error("Error adding remark:", error);
       toast.error("Fehler beim Hinzufügen der Bemerkung");
@@ -252,7 +280,7 @@ export default function CustomerDetails({ user, onLogout }) {
         upload2: null,
         upload3: null,
       });
-      fetchCustomer();
+      fetchCorrespondence();
     } catch (error) {
       console.error("Error adding correspondence:", error);
       toast.error("Fehler beim Hinzufügen der Korrespondenz");
@@ -389,19 +417,19 @@ export default function CustomerDetails({ user, onLogout }) {
           {/* Remarks Section */}
           <Card>
             <CardHeader className="bg-gradient-to-r from-amber-500 to-orange-600 text-white flex flex-row justify-between items-center">
-              <CardTitle>Bemerkungen ({customer.bemerkungen?.length || 0})</CardTitle>
+              <CardTitle>Bemerkungen ({remarks.length})</CardTitle>
               <Button variant="secondary" size="sm" onClick={() => setRemarkDialogOpen(true)} data-testid="add-remark-button">
                 <Plus className="w-4 h-4 mr-1" />
                 Hinzufügen
               </Button>
             </CardHeader>
             <CardContent className="pt-6">
-              {!customer.bemerkungen || customer.bemerkungen.length === 0 ? (
+              {remarks.length === 0 ? (
                 <p className="text-gray-500 text-center py-4">Keine Bemerkungen vorhanden</p>
               ) : (
                 <div className="space-y-4">
-                  {customer.bemerkungen.map((remark, index) => (
-                    <div key={index} className="border-l-4 border-amber-500 pl-4 py-2 bg-gray-50">
+                  {remarks.map((remark) => (
+                    <div key={remark.id} className="border-l-4 border-amber-500 pl-4 py-2 bg-gray-50">
                       <p className="text-sm text-gray-700">{remark.text}</p>
                       <p className="text-xs text-gray-500 mt-1">
                         {formatDateTime(remark.timestamp)} - {remark.user}
@@ -451,18 +479,18 @@ export default function CustomerDetails({ user, onLogout }) {
           {/* Correspondence Section */}
           <Card>
             <CardHeader className="bg-gradient-to-r from-indigo-500 to-purple-600 text-white flex flex-row justify-between items-center">
-              <CardTitle>Korrespondenz ({customer.korrespondenz?.length || 0})</CardTitle>
+              <CardTitle>Korrespondenz ({correspondence.length})</CardTitle>
               <Button variant="secondary" size="sm" onClick={() => setCorrespondenceDialogOpen(true)} data-testid="add-correspondence-button">
                 <Plus className="w-4 h-4 mr-1" />
                 Hinzufügen
               </Button>
             </CardHeader>
             <CardContent className="pt-6">
-              {!customer.korrespondenz || customer.korrespondenz.length === 0 ? (
+              {correspondence.length === 0 ? (
                 <p className="text-gray-500 text-center py-4">Keine Korrespondenz vorhanden</p>
               ) : (
                 <Accordion type="single" collapsible className="w-full">
-                  {[...customer.korrespondenz].sort((a, b) => new Date(`${b.datum}T${b.zeit}`) - new Date(`${a.datum}T${a.zeit}`)).map((korr, index) => (
+                  {[...correspondence].sort((a, b) => new Date(`${b.datum}T${b.zeit}`) - new Date(`${a.datum}T${a.zeit}`)).map((korr, index) => (
                     <AccordionItem key={index} value={`korr-${index}`}>
                       <AccordionTrigger className="hover:no-underline">
                         <div className="flex items-center justify-between w-full pr-4">
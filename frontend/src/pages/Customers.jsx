@@ -8,6 +8,8 @@ import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from
 import { Label } from "@/components/ui/label";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
 import { toast } from "sonner";
+import LoadMore from "@/components/LoadMore";
+import { usePaginatedList } from "@/hooks/use-paginated-list";
 import { Plus, Search, Eye, Upload, Download, ArrowUpDown } from "lucide-react";
 import { useNavigate } from "react-router-dom";
 
@@ -15,10 +17,24 @@ const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 export default function Customers({ user, onLogout }) {
-  const [customers, setCustomers] = useState([]);
-  const [filteredCustomers, setFilteredCustomers] = useState([]);
-  const [searchTerm, setSearchTerm] = useState("");
   const [sortOrder, setSortOrder] = useState("asc"); // asc or desc
+  const [searchTerm, setSearchTerm] = useState("");
+  const [query, setQuery] = useState("");
+  // Sorted on the server, the pages arrive in name order
+  const sort = sortOrder === "asc" ? "name" : "-name";
+  // Search results are paged like the list, both follow X-Next-Cursor
+  const {
+    items: customers,
+    hasMore,
+    loading,
+    reload: fetchCustomers,
+    loadMore,
+  } = usePaginatedList(
+    query ? "/customers/search" : "/customers",
+    query
+      ? { params: { q: query, sort }, errorMessage: "Fehler bei der Kundensuche" }
+      : { params: { view: "summary", sort }, errorMessage: "Fehler beim Laden der Kunden" }
+  );
   const [dialogOpen, setDialogOpen] = useState(false);
   const [uploadDialogOpen, setUploadDialogOpen] = useState(false);
   const [uploading, setUploading] = useState(false);
@@ -41,44 +57,10 @@ export default function Customers({ user, onLogout }) {
   const navigate = useNavigate();
 
   useEffect(() => {
-    fetchCustomers();
-  }, []);
-
-  useEffect(() => {
-    let filtered = customers.filter(
-      (customer) =>
-        customer.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        customer.vorname.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        customer.kunden_nr.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        (customer.firma && customer.firma.toLowerCase().includes(searchTerm.toLowerCase()))
-    );
-    
-    // Sort by name
-    filtered = filtered.sort((a, b) => {
-      const nameA = a.name.toLowerCase();
-      const nameB = b.name.toLowerCase();
-      if (sortOrder === "asc") {
-        return nameA.localeCompare(nameB);
-      } else {
-        return nameB.localeCompare(nameA);
-      }
-    });
-    
-    setFilteredCustomers(filtered);
-  }, [searchTerm, customers, sortOrder]);
-
-  const fetchCustomers = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/customers`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setCustomers(response.data);
-    } catch (error) {
-      console.error("Error fetching customers:", error);
-      toast.error("Fehler beim Laden der Kunden");
-    }
-  };
+    // Debounced server-side search
+    const timeout = setTimeout(() => setQuery(searchTerm.trim()), 250);
+    return () => clearTimeout(timeout);
+  }, [searchTerm]);
 
   const toggleSortOrder = () => {
     setSortOrder(sortOrder === "asc" ? "desc" : "asc");
@@ -370,7 +352,7 @@ export default function Customers({ user, onLogout }) {
 
         <Card>
           <CardHeader className="bg-gradient-to-r from-blue-500 to-purple-600 text-white">
-            <CardTitle>Kundenliste ({filteredCustomers.length})</CardTitle>
+            <CardTitle>Kundenliste ({customers.length}{hasMore ? "+" : ""})</CardTitle>
           </CardHeader>
           <CardContent className="p-0">
             <div className="overflow-x-auto">
@@ -398,7 +380,7 @@ export default function Customers({ user, onLogout }) {
                   </TableRow>
                 </TableHeader>
                 <TableBody>
-                  {filteredCustomers.map((customer) => (
+                  {customers.map((customer) => (
                     <TableRow key={customer.id} data-testid={`customer-row-${customer.id}`}>
                       <TableCell className="font-medium">{customer.kunden_nr}</TableCell>
                       <TableCell>{customer.name}</TableCell>
@@ -426,11 +408,12 @@ export default function Customers({ user, onLogout }) {
               </Table>
             </div>
 
-            {filteredCustomers.length === 0 && (
+            {customers.length === 0 && (
               <div className="text-center py-12 text-gray-500">
                 <p className="text-lg">Keine Kunden gefunden</p>
               </div>
             )}
+            <LoadMore hasMore={hasMore} loading={loading} onLoadMore={loadMore} />
           </CardContent>
         </Card>
       </div>
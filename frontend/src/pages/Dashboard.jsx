@@ -22,19 +22,10 @@ export default function Dashboard({ user, onLogout }) {
   const fetchStats = async () => {
     const token = localStorage.getItem("token");
     try {
-      const [customersRes, vehiclesRes, employeesRes, tasksRes] = await Promise.all([
-        axios.get(`${API}/customers`, { headers: { Authorization: `Bearer ${token}` } }),
-        axios.get(`${API}/vehicles`, { headers: { Authorization: `Bearer ${token}` } }),
-        axios.get(`${API}/employees`, { headers: { Authorization: `Bearer ${token}` } }),
-        axios.get(`${API}/tasks/my`, { headers: { Authorization: `Bearer ${token}` } }),
-      ]);
-
-      setStats({
-        customers: customersRes.data.length,
-        vehicles: vehiclesRes.data.length,
-        employees: employeesRes.data.length,
-        tasks: tasksRes.data.filter(t => t.status === "offen").length,
+      const response = await axios.get(`${API}/dashboard/stats`, {
+        headers: { Authorization: `Bearer ${token}` },
       });
+      setStats(response.data);
     } catch (error) {
       console.error("Error fetching stats:", error);
     }
@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useState } from "react";
 import Layout from "@/components/Layout";
 import axios from "axios";
 import { Button } from "@/components/ui/button";
@@ -7,13 +7,21 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from "@/components/ui/dialog";
 import { Label } from "@/components/ui/label";
 import { toast } from "sonner";
+import LoadMore from "@/components/LoadMore";
+import { usePaginatedList } from "@/hooks/use-paginated-list";
 import { Plus, Briefcase, Trash2, Edit } from "lucide-react";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 export default function Employees({ user, onLogout }) {
-  const [employees, setEmployees] = useState([]);
+  const {
+    items: employees,
+    hasMore,
+    loading,
+    reload: fetchEmployees,
+    loadMore,
+  } = usePaginatedList("/employees", { errorMessage: "Fehler beim Laden der Mitarbeiter" });
   const [dialogOpen, setDialogOpen] = useState(false);
   const [editDialogOpen, setEditDialogOpen] = useState(false);
   const [selectedEmployee, setSelectedEmployee] = useState(null);
@@ -29,23 +37,6 @@ export default function Employees({ user, onLogout }) {
     geburtstag: "",
   });
 
-  useEffect(() => {
-    fetchEmployees();
-  }, []);
-
-  const fetchEmployees = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/employees`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setEmployees(response.data);
-    } catch (error) {
-      console.error("Error fetching employees:", error);
-      toast.error("Fehler beim Laden der Mitarbeiter");
-    }
-  };
-
   const calculateAge = (birthday) => {
     if (!birthday) return "-";
     const birthDate = new Date(birthday);
@@ -315,6 +306,7 @@ export default function Employees({ user, onLogout }) {
             <p className="text-lg">Keine Mitarbeiter gefunden</p>
           </div>
         )}
+        <LoadMore hasMore={hasMore} loading={loading} onLoadMore={loadMore} />
       </div>
 
       {/* Edit Dialog */}
@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useState } from "react";
 import Layout from "@/components/Layout";
 import axios from "axios";
 import { Button } from "@/components/ui/button";
@@ -10,13 +10,21 @@ import { Accordion, AccordionContent, AccordionItem, AccordionTrigger } from "@/
 import { Label } from "@/components/ui/label";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { toast } from "sonner";
+import LoadMore from "@/components/LoadMore";
+import { usePaginatedList } from "@/hooks/use-paginated-list";
 import { Plus, FileText, Trash2 } from "lucide-react";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 export default function Kaufvertraege({ user, onLogout }) {
-  const [vertraege, setVertraege] = useState([]);
+  const {
+    items: vertraege,
+    hasMore,
+    loading,
+    reload: fetchVertraege,
+    loadMore,
+  } = usePaginatedList("/kaufvertraege", { errorMessage: "Fehler beim Laden der Kaufverträge" });
   const [dialogOpen, setDialogOpen] = useState(false);
   const [uploading, setUploading] = useState(false);
   const [formData, setFormData] = useState({
@@ -55,23 +63,6 @@ export default function Kaufvertraege({ user, onLogout }) {
     additional: [],
   });
 
-  useEffect(() => {
-    fetchVertraege();
-  }, []);
-
-  const fetchVertraege = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/kaufvertraege`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setVertraege(response.data);
-    } catch (error) {
-      console.error("Error fetching kaufvertraege:", error);
-      toast.error("Fehler beim Laden der Kaufverträge");
-    }
-  };
-
   const handleFileUpload = async (file) => {
     const token = localStorage.getItem("token");
     const formData = new FormData();
@@ -571,6 +562,7 @@ export default function Kaufvertraege({ user, onLogout }) {
             <p className="text-lg">Keine Kaufverträge vorhanden</p>
           </div>
         )}
+        <LoadMore hasMore={hasMore} loading={loading} onLoadMore={loadMore} />
       </div>
     </Layout>
   );
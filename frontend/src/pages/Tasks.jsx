@@ -11,14 +11,18 @@ import { Label } from "@/components/ui/label";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
 import { toast } from "sonner";
+import CustomerSelect from "@/components/CustomerSelect";
+import LoadMore from "@/components/LoadMore";
+import { applyLiveEvent, useLiveEvents } from "@/hooks/use-live-events";
+import { usePaginatedList } from "@/hooks/use-paginated-list";
 import { Plus, CheckCircle, Clock } from "lucide-react";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 export default function Tasks({ user, onLogout }) {
-  const [tasks, setTasks] = useState([]);
-  const [customers, setCustomers] = useState([]);
+  const myTasks = usePaginatedList("/tasks/my", { errorMessage: "Fehler beim Laden der Aufgaben" });
+  const allTasks = usePaginatedList("/tasks", { errorMessage: "Fehler beim Laden der Aufgaben" });
   const [users, setUsers] = useState([]);
   const [dialogOpen, setDialogOpen] = useState(false);
   const [formData, setFormData] = useState({
@@ -33,34 +37,19 @@ export default function Tasks({ user, onLogout }) {
   });
 
   useEffect(() => {
-    fetchTasks();
-    fetchCustomers();
     fetchUsers();
   }, []);
 
-  const fetchTasks = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/tasks`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setTasks(response.data);
-    } catch (error) {
-      console.error("Error fetching tasks:", error);
-      toast.error("Fehler beim Laden der Aufgaben");
-    }
-  };
+  useLiveEvents("task", (event) => {
+    allTasks.setItems((current) => applyLiveEvent(current, event));
+    // A task reassigned to someone else leaves "Meine Aufgaben"
+    const mine = event.action === "deleted" || event.data.assigned_to === user.id;
+    myTasks.setItems((current) => applyLiveEvent(current, mine ? event : { ...event, action: "deleted" }));
+  });
 
-  const fetchCustomers = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/customers`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setCustomers(response.data);
-    } catch (error) {
-      console.error("Error fetching customers:", error);
-    }
+  const fetchTasks = () => {
+    myTasks.reload();
+    allTasks.reload();
   };
 
   const fetchUsers = async () => {
@@ -68,6 +57,7 @@ export default function Tasks({ user, onLogout }) {
     try {
       const response = await axios.get(`${API}/users`, {
         headers: { Authorization: `Bearer ${token}` },
+        params: { limit: 1000 },
       });
       setUsers(response.data);
     } catch (error) {
@@ -77,6 +67,10 @@ export default function Tasks({ user, onLogout }) {
 
   const handleSubmit = async (e) => {
     e.preventDefault();
+    if (!formData.customer_id) {
+      toast.error("Bitte einen Kunden auswählen");
+      return;
+    }
     const token = localStorage.getItem("token");
 
     try {
@@ -118,16 +112,13 @@ export default function Tasks({ user, onLogout }) {
     }
   };
 
-  const handleCustomerSelect = (customerId) => {
-    const customer = customers.find((c) => c.id === customerId);
-    if (customer) {
-      setFormData({
-        ...formData,
-        customer_id: customerId,
-        customer_name: `${customer.vorname} ${customer.name}`,
-        telefon_nummer: customer.telefon_p || customer.telefon_g || customer.natel || "",
-      });
-    }
+  const handleCustomerSelect = (customer) => {
+    setFormData({
+      ...formData,
+      customer_id: customer.id,
+      customer_name: `${customer.vorname} ${customer.name}`,
+      telefon_nummer: customer.telefon_p || customer.telefon_g || customer.natel || "",
+    });
   };
 
   const handleUserSelect = (userId) => {
@@ -150,10 +141,10 @@ export default function Tasks({ user, onLogout }) {
     });
   };
 
-  const myOpenTasks = sortTasksByDate(tasks.filter((task) => task.assigned_to === user.id && task.status === "offen"));
-  const myClosedTasks = sortTasksByDate(tasks.filter((task) => task.assigned_to === user.id && task.status === "erledigt"));
-  const allOpenTasks = sortTasksByDate(tasks.filter((task) => task.status === "offen"));
-  const allClosedTasks = sortTasksByDate(tasks.filter((task) => task.status === "erledigt"));
+  const myOpenTasks = sortTasksByDate(myTasks.items.filter((task) => task.status === "offen"));
+  const myClosedTasks = sortTasksByDate(myTasks.items.filter((task) => task.status === "erledigt"));
+  const allOpenTasks = sortTasksByDate(allTasks.items.filter((task) => task.status === "offen"));
+  const allClosedTasks = sortTasksByDate(allTasks.items.filter((task) => task.status === "erledigt"));
 
   return (
     <Layout user={user} onLogout={onLogout}>
@@ -176,18 +167,7 @@ export default function Tasks({ user, onLogout }) {
               <form onSubmit={handleSubmit} className="space-y-4">
                 <div className="space-y-2">
                   <Label htmlFor="customer">Kunde*</Label>
-                  <Select onValueChange={handleCustomerSelect} required>
-                    <SelectTrigger data-testid="task-customer-select">
-                      <SelectValue placeholder="Kunde auswählen" />
-                    </SelectTrigger>
-                    <SelectContent>
-                      {customers.map((customer) => (
-                        <SelectItem key={customer.id} value={customer.id}>
-                          {customer.vorname} {customer.name} (Nr: {customer.kunden_nr})
-                        </SelectItem>
-                      ))}
-                    </SelectContent>
-                  </Select>
+                  <CustomerSelect onSelect={handleCustomerSelect} testId="task-customer-select" />
                 </div>
 
                 <div className="grid grid-cols-2 gap-4">
@@ -341,6 +321,7 @@ export default function Tasks({ user, onLogout }) {
                 )}
               </TabsContent>
             </Tabs>
+            <LoadMore hasMore={myTasks.hasMore} loading={myTasks.loading} onLoadMore={myTasks.loadMore} />
           </CardContent>
         </Card>
 
@@ -416,6 +397,7 @@ export default function Tasks({ user, onLogout }) {
                 )}
               </TabsContent>
             </Tabs>
+            <LoadMore hasMore={allTasks.hasMore} loading={allTasks.loading} onLoadMore={allTasks.loadMore} />
           </CardContent>
         </Card>
       </div>
@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useState } from "react";
 import Layout from "@/components/Layout";
 import axios from "axios";
 import { Button } from "@/components/ui/button";
@@ -8,13 +8,21 @@ import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from
 import { Label } from "@/components/ui/label";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { toast } from "sonner";
+import LoadMore from "@/components/LoadMore";
+import { usePaginatedList } from "@/hooks/use-paginated-list";
 import { Plus, UserCog, Trash2 } from "lucide-react";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 export default function Users({ user, onLogout }) {
-  const [users, setUsers] = useState([]);
+  const {
+    items: users,
+    hasMore,
+    loading,
+    reload: fetchUsers,
+    loadMore,
+  } = usePaginatedList("/users", { errorMessage: "Fehler beim Laden der Benutzer" });
   const [dialogOpen, setDialogOpen] = useState(false);
   const [formData, setFormData] = useState({
     username: "",
@@ -23,23 +31,6 @@ export default function Users({ user, onLogout }) {
     role: "user",
   });
 
-  useEffect(() => {
-    fetchUsers();
-  }, []);
-
-  const fetchUsers = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/users`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setUsers(response.data);
-    } catch (error) {
-      console.error("Error fetching users:", error);
-      toast.error("Fehler beim Laden der Benutzer");
-    }
-  };
-
   const handleSubmit = async (e) => {
     e.preventDefault();
     const token = localStorage.getItem("token");
@@ -199,6 +190,7 @@ export default function Users({ user, onLogout }) {
             <p className="text-lg">Keine Benutzer gefunden</p>
           </div>
         )}
+        <LoadMore hasMore={hasMore} loading={loading} onLoadMore={loadMore} />
       </div>
     </Layout>
   );
@@ -7,6 +7,8 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from "@/components/ui/dialog";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
 import { toast } from "sonner";
+import LoadMore from "@/components/LoadMore";
+import { usePaginatedList } from "@/hooks/use-paginated-list";
 import { Search, Car as CarIcon, Upload, Download } from "lucide-react";
 import { useNavigate } from "react-router-dom";
 
@@ -14,58 +16,63 @@ const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
 export default function Vehicles({ user, onLogout }) {
-  const [vehicles, setVehicles] = useState([]);
-  const [customers, setCustomers] = useState([]);
-  const [filteredVehicles, setFilteredVehicles] = useState([]);
   const [searchTerm, setSearchTerm] = useState("");
+  const [query, setQuery] = useState("");
+  const {
+    items: vehicles,
+    hasMore,
+    loading,
+    reload: fetchVehicles,
+    loadMore,
+  } = usePaginatedList("/vehicles", {
+    params: query ? { view: "summary", q: query } : { view: "summary" },
+    errorMessage: "Fehler beim Laden der Fahrzeuge",
+  });
+  const [customers, setCustomers] = useState({});
   const [uploadDialogOpen, setUploadDialogOpen] = useState(false);
   const [uploading, setUploading] = useState(false);
   const fileInputRef = useRef(null);
   const navigate = useNavigate();
 
   useEffect(() => {
-    fetchVehicles();
-    fetchCustomers();
-  }, []);
+    // Only the customers of the loaded vehicles, fetched once each
+    const missing = [...new Set(vehicles.map((vehicle) => vehicle.customer_id))].filter((id) => !(id in customers));
+    if (missing.length > 0) {
+      fetchCustomers(missing);
+    }
+  }, [vehicles]);
 
   useEffect(() => {
-    const filtered = vehicles.filter(
-      (vehicle) =>
-        vehicle.marke.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        vehicle.modell.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        (vehicle.chassis_nr && vehicle.chassis_nr.toLowerCase().includes(searchTerm.toLowerCase()))
-    );
-    setFilteredVehicles(filtered);
-  }, [searchTerm, vehicles]);
-
-  const fetchVehicles = async () => {
-    const token = localStorage.getItem("token");
-    try {
-      const response = await axios.get(`${API}/vehicles`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setVehicles(response.data);
-      setFilteredVehicles(response.data);
-    } catch (error) {
-      console.error("Error fetching vehicles:", error);
-      toast.error("Fehler beim Laden der Fahrzeuge");
-    }
-  };
+    // Debounced server-side search, so it covers the vehicles not loaded yet
+    const timeout = setTimeout(() => setQuery(searchTerm.trim()), 250);
+    return () => clearTimeout(timeout);
+  }, [searchTerm]);
 
-  const fetchCustomers = async () => {
+  const fetchCustomers = async (ids) => {
     const token = localStorage.getItem("token");
     try {
       const response = await axios.get(`${API}/customers`, {
         headers: { Authorization: `Bearer ${token}` },
+        params: { view: "summary", ids, limit: ids.length },
+        paramsSerializer: { indexes: null },
+      });
+      setCustomers((current) => {
+        const next = { ...current };
+        ids.forEach((id) => {
+          next[id] = null;
+        });
+        response.data.forEach((customer) => {
+          next[customer.id] = customer;
+        });
+        return next;
       });
-      setCustomers(response.data);
     } catch (error) {
       console.error("Error fetching customers:", error);
     }
   };
 
   const getCustomerName = (customerId) => {
-    const customer = customers.find((c) => c.id === customerId);
+    const customer = customers[customerId];
     return customer ? `${customer.vorname} ${customer.name}` : "Unbekannt";
   };
 
@@ -177,7 +184,7 @@ export default function Vehicles({ user, onLogout }) {
 
         <Card>
           <CardHeader className="bg-gradient-to-r from-green-500 to-teal-600 text-white">
-            <CardTitle>Fahrzeugliste ({filteredVehicles.length})</CardTitle>
+            <CardTitle>Fahrzeugliste ({vehicles.length}{hasMore ? "+" : ""})</CardTitle>
           </CardHeader>
           <CardContent className="p-0">
             <div className="overflow-x-auto">
@@ -196,7 +203,7 @@ export default function Vehicles({ user, onLogout }) {
                   </TableRow>
                 </TableHeader>
                 <TableBody>
-                  {filteredVehicles.map((vehicle) => (
+                  {vehicles.map((vehicle) => (
                     <TableRow key={vehicle.id} data-testid={`vehicle-row-${vehicle.id}`}>
                       <TableCell className="font-medium">{vehicle.marke}</TableCell>
                       <TableCell>{vehicle.modell}</TableCell>
@@ -222,11 +229,12 @@ export default function Vehicles({ user, onLogout }) {
               </Table>
             </div>
 
-            {filteredVehicles.length === 0 && (
+            {vehicles.length === 0 && (
               <div className="text-center py-12 text-gray-500">
                 <p className="text-lg">Keine Fahrzeuge gefunden</p>
               </div>
             )}
+            <LoadMore hasMore={hasMore} loading={loading} onLoadMore={loadMore} />
           </CardContent>
         </Card>
       </div>
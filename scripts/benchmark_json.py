@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Compare the pydantic and orjson paths for large list responses.
+
+Serializes generated Customer and Task rows (1k, 10k and 50k) both the way
+FastAPI does for response_model=List[...] and through fast_json_response,
+and prints the best of three timings per path. Reads backend/.env like the
+server, but needs no running database.
+
+  python scripts/benchmark_json.py
+"""
+import sys
+import time
+import uuid
+import copy
+from pathlib import Path
+from datetime import datetime, timezone, timedelta
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from dotenv import load_dotenv
+
+# Load environment variables
+backend_dir = Path(__file__).parent.parent / 'backend'
+load_dotenv(backend_dir / '.env')
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+# Importing the app only builds models and an idle Motor client, no database is needed
+from server import Customer, Task, fast_json_response
+
+ROW_COUNTS = [1000, 10000, 50000]
+REPEATS = 3
+
+def make_customers(count):
+    now = datetime.now(timezone.utc)
+    return [{
+        "id": str(uuid.uuid4()),
+        "kunden_nr": f"K{i:06d}",
+        "vorname": "Hans",
+        "name": f"Muster{i}",
+        "firma": "Garage Muster AG" if i % 5 == 0 else "",
+        "strasse": "Bahnhofstrasse 1",
+        "plz": "8001",
+        "ort": "Zürich",
+        "telefon_p": "044 123 45 67",
+        "telefon_g": "",
+        "natel": "079 123 45 67",
+        "email_p": f"hans{i}@example.ch",
+        "email_g": "",
+        "geburtsdatum": "1980-01-01",
+        "created_at": now - timedelta(minutes=i),
+    } for i in range(count)]
+
+def make_tasks(count):
+    now = datetime.now(timezone.utc)
+    return [{
+        "id": str(uuid.uuid4()),
+        "customer_id": str(uuid.uuid4()),
+        "customer_name": f"Hans Muster{i}",
+        "datum_kontakt": datetime(2025, 1, 1 + i % 28, tzinfo=timezone.utc),
+        "zeitpunkt_kontakt": "10:00",
+        "bemerkungen": "Offerte nachfassen",
+        "telefon_nummer": "079 123 45 67",
+        "assigned_to": "user-1",
+        "assigned_to_name": "Verkauf",
+        "status": "offen",
+        "created_by": "admin",
+        "created_at": now - timedelta(minutes=i),
+    } for i in range(count)]
+
+def pydantic_path(adapter, rows):
+    # What FastAPI does for response_model=List[...]: validate, dump to JSON-able data, json.dumps
+    return JSONResponse(adapter.dump_python(adapter.validate_python(rows), mode="json")).body
+
+def fast_path(rows, date_fields):
+    return fast_json_response(rows, Response(), date_fields).body
+
+def best_of(func, make_input):
+    timings = []
+    for _ in range(REPEATS):
+        rows = make_input()
+        start = time.perf_counter()
+        func(rows)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run_benchmark():
+    print(f"{'model':<10}{'rows':>8}{'pydantic ms':>14}{'orjson ms':>12}{'speedup':>10}")
+    for name, model, make_rows, date_fields in [
+        ("Customer", Customer, make_customers, ()),
+        ("Task", Task, make_tasks, ("datum_kontakt",)),
+    ]:
+        adapter = TypeAdapter(List[model])
+        for count in ROW_COUNTS:
+            rows = make_rows(count)
+            slow = best_of(lambda r: pydantic_path(adapter, r), lambda: copy.deepcopy(rows))
+            fast = best_of(lambda r: fast_path(r, date_fields), lambda: copy.deepcopy(rows))
+            print(f"{name:<10}{count:>8}{slow * 1000:>14.1f}{fast * 1000:>12.1f}{slow / fast:>9.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Report upload storage usage and remove orphaned uploads.
+
+Files no correspondence entry, client experience or Kaufvertrag refers to
+are removed once they are older than the grace period. Meant for cron:
+
+  python scripts/cleanup_uploads.py            # report only
+  python scripts/cleanup_uploads.py --delete
+"""
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from dotenv import load_dotenv
+
+# Load environment variables
+backend_dir = Path(__file__).parent.parent / 'backend'
+load_dotenv(backend_dir / '.env')
+
+import server
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--delete", action="store_true", help="Remove orphaned uploads instead of only reporting them")
+    parser.add_argument("--grace-hours", type=float, default=server.UPLOAD_GC_GRACE_HOURS,
+                        help="Only touch unreferenced files older than this")
+    return parser.parse_args()
+
+def megabytes(size):
+    return f"{size / (1024 * 1024):.1f} MB"
+
+async def cleanup_uploads():
+    args = parse_args()
+    report = await server.collect_uploads(delete=args.delete, grace_hours=args.grace_hours)
+
+    print(f"{server.UPLOAD_DIR}: {report['total']['files']} files, {megabytes(report['total']['bytes'])}")
+    for collection_name, usage in report["usage"].items():
+        print(f"  {collection_name:<20} {usage['files']:>8} files {megabytes(usage['bytes']):>12}")
+    print(f"  {'derivatives':<20} {report['derivatives']['files']:>8} files {megabytes(report['derivatives']['bytes']):>12}")
+    print(f"  {'unreferenced':<20} {report['unreferenced']['files']:>8} files {megabytes(report['unreferenced']['bytes']):>12}")
+
+    orphans = report["orphans"]
+    action = "Removed" if args.delete else "Would remove"
+    print(f"{action} {orphans['files']} orphaned uploads older than {args.grace_hours:g}h ({megabytes(orphans['bytes'])})"
+          f" and {report['stale_derivatives']['files']} stale derivatives")
+    for filename in orphans["filenames"]:
+        print(f"  {filename}")
+    if report["missing"]["files"]:
+        print(f"{report['missing']['files']} referenced files are missing on disk")
+
+    server.client.close()
+
+if __name__ == "__main__":
+    asyncio.run(cleanup_uploads())
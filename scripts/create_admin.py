@@ -39,7 +39,7 @@ async def create_admin():
         "name": "Administrator",
         "password": pwd_context.hash("admin123"),  # Change this password!
         "role": "admin",
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     }
     
     await db.users.insert_one(admin_user)
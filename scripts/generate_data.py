@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""Generate production-size CRM data for local benchmarks.
+
+Bulk-inserts realistic Swiss customers with their vehicles, remarks,
+correspondence, tasks, client experiences and Kaufverträge. The same seed
+always produces the same data.
+
+  python scripts/generate_data.py --customers 100000 --vehicles 3 --drop
+"""
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from datetime import datetime, timezone, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from dotenv import load_dotenv
+
+# Load environment variables
+backend_dir = Path(__file__).parent.parent / 'backend'
+load_dotenv(backend_dir / '.env')
+
+from server import INDEXES, index_name, customer_search_terms, pwd_context
+
+GENERATED_COLLECTIONS = ["users", "customers", "vehicles", "remarks", "correspondence", "tasks", "client_experiences", "kaufvertraege"]
+GENERATED_PASSWORD = "verkauf123"
+# Fixed anchor so a seed reproduces identical timestamps on every run
+DATA_END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+DATA_YEARS = 5
+
+VORNAMEN = ["Anna", "Beat", "Claudia", "Daniel", "Eva", "Fritz", "Gabriela", "Hans", "Heidi", "Iris", "Jürg", "Karin",
+            "Lukas", "Marco", "Nicole", "Ottilia", "Peter", "Regula", "Reto", "Sandra", "Thomas", "Ursula", "Urs",
+            "Vreni", "Werner", "Yvonne", "Laura", "Luca", "Noah", "Mia", "Elena", "Matteo"]
+NAMEN = ["Müller", "Meier", "Schmid", "Keller", "Weber", "Huber", "Schneider", "Meyer", "Steiner", "Fischer", "Gerber",
+         "Brunner", "Baumann", "Frei", "Zimmermann", "Moser", "Widmer", "Wyss", "Graf", "Roth", "Suter", "Baumgartner",
+         "Bachmann", "Studer", "Bühler", "Kälin", "Marti", "Hofer", "Lüthi", "Bianchi", "Rossi", "Favre"]
+PLZ_ORT = [("8001", "Zürich"), ("8004", "Zürich"), ("8400", "Winterthur"), ("8600", "Dübendorf"), ("8610", "Uster"),
+           ("8700", "Küsnacht"), ("8800", "Thalwil"), ("8840", "Einsiedeln"), ("9000", "St. Gallen"),
+           ("9500", "Wil"), ("6003", "Luzern"), ("6300", "Zug"), ("6430", "Schwyz"), ("3011", "Bern"),
+           ("3600", "Thun"), ("2502", "Biel/Bienne"), ("4051", "Basel"), ("4410", "Liestal"), ("4600", "Olten"),
+           ("5000", "Aarau"), ("5400", "Baden"), ("7000", "Chur"), ("1003", "Lausanne"), ("1201", "Genève"),
+           ("1700", "Fribourg"), ("6900", "Lugano"), ("6500", "Bellinzona"), ("8200", "Schaffhausen"),
+           ("8500", "Frauenfeld"), ("8640", "Rapperswil-Jona")]
+STRASSEN = ["Bahnhofstrasse", "Hauptstrasse", "Dorfstrasse", "Kirchweg", "Seestrasse", "Schulstrasse", "Gartenweg",
+            "Industriestrasse", "Poststrasse", "Bergstrasse", "Feldweg", "Rosenweg", "Landstrasse", "Lindenstrasse"]
+FIRMEN = ["Garage", "Transport", "Bau", "Immobilien", "Treuhand", "Elektro", "Sanitär", "Informatik"]
+FIRMEN_FORMEN = ["AG", "GmbH", "& Co.", "Söhne AG"]
+EMAIL_DOMAINS = ["bluewin.ch", "gmx.ch", "sunrise.ch", "hispeed.ch", "gmail.com", "outlook.com"]
+NATEL_PREFIXES = ["076", "077", "078", "079"]
+VORWAHLEN = ["044", "052", "071", "041", "031", "061", "062", "081", "021", "022", "091"]
+FAHRZEUGE = {
+    "VW": ["Golf", "Polo", "Tiguan", "Passat", "ID.3", "ID.4", "T-Roc"],
+    "Audi": ["A3", "A4", "A6", "Q3", "Q5", "e-tron"],
+    "Skoda": ["Octavia", "Fabia", "Kodiaq", "Enyaq", "Superb"],
+    "SEAT": ["Ibiza", "Leon", "Ateca"],
+    "Cupra": ["Formentor", "Born"],
+}
+FARBEN = ["Schwarz", "Weiss", "Silber", "Grau", "Blau", "Rot", "Grün", "Moonstone Grey"]
+BEMERKUNGEN = ["Rückruf vereinbart", "Interessiert an Probefahrt", "Offerte gesendet", "Service-Termin bestätigt",
+               "Reifenwechsel gewünscht", "Leasingvertrag läuft aus", "Kunde meldet Garantiefall", "Zufrieden mit Service"]
+KORRESPONDENZ = ["Offerte", "Rechnung", "Service-Erinnerung", "Auftragsbestätigung", "Mahnung", "Newsletter"]
+REKLAMATIONEN = ["Wartezeit beim Service zu lang", "Kratzer nach Reparatur", "Rechnung unklar",
+                 "Ersatzwagen nicht bereit", "Motorkontrollleuchte erneut an", "Lieferung verspätet"]
+FAHRZEUG_TYPEN = ["Neuwagen", "Vorführwagen", "Occasion"]
+MARKEN = list(FAHRZEUGE)
+VIN_CHARS = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
+UUID4_CLEAR = ~((0xf000 << 64) | (0xc000 << 48))
+UUID4_SET = (0x4000 << 64) | (0x8000 << 48)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=os.environ.get("DB_NAME"), help="Target database (default DB_NAME)")
+    parser.add_argument("--customers", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=10, help="Sales users that tasks are assigned to")
+    # Averages per customer, fractions are rounded up or down at random
+    parser.add_argument("--vehicles", type=float, default=3.0)
+    parser.add_argument("--remarks", type=float, default=2.0)
+    parser.add_argument("--correspondence", type=float, default=0.5)
+    parser.add_argument("--tasks", type=float, default=0.3)
+    parser.add_argument("--complaints", type=float, default=0.05)
+    parser.add_argument("--contracts", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--writers", type=int, default=8, help="Parallel insert_many writers")
+    parser.add_argument("--drop", action="store_true", help="Drop the generated collections first")
+    return parser.parse_args()
+
+class DataGenerator:
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    # Cheaper than Random.choice/randint, which dominate the generation time
+    def pick(self, items):
+        return items[int(self.rng.random() * len(items))]
+
+    def number(self, low: int, high: int) -> int:
+        return low + int(self.rng.random() * (high - low + 1))
+
+    def uuid(self) -> str:
+        # Random version-4 layout without the overhead of uuid.UUID()
+        value = f"{self.rng.getrandbits(128) & UUID4_CLEAR | UUID4_SET:032x}"
+        return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+    def count(self, average: float) -> int:
+        whole = int(average)
+        return whole + (self.rng.random() < average - whole)
+
+    def phone(self, prefixes: list) -> str:
+        return f"{self.pick(prefixes)} {self.number(100, 999)} {self.number(10, 99)} {self.number(10, 99)}"
+
+    def date(self, start: datetime, end: datetime) -> datetime:
+        # Calendar dates are stored as midnight UTC
+        day = start + timedelta(seconds=self.rng.uniform(0, max((end - start).total_seconds(), 0)))
+        return day.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def time(self) -> str:
+        return f"{self.number(7, 18):02d}:{self.pick(['00', '15', '30', '45'])}"
+
+    def users(self, count: int, password_hash: str) -> list:
+        return [{
+            "id": self.uuid(),
+            "username": f"verkauf{n + 1}",
+            "name": f"{self.pick(VORNAMEN)} {self.pick(NAMEN)}",
+            "role": "user",
+            "password": password_hash,
+            "created_at": DATA_END - timedelta(days=DATA_YEARS * 365),
+        } for n in range(count)]
+
+    def customer(self, index: int, created_at: datetime) -> dict:
+        rng = self.rng
+        vorname = self.pick(VORNAMEN)
+        name = self.pick(NAMEN)
+        plz, ort = self.pick(PLZ_ORT)
+        mail = f"{vorname}.{name}".lower().replace("ä", "ae").replace("ö", "oe").replace("ü", "ue")
+        firma = f"{name} {self.pick(FIRMEN)} {self.pick(FIRMEN_FORMEN)}" if rng.random() < 0.15 else ""
+        customer = {
+            "id": self.uuid(),
+            "kunden_nr": f"G{index + 1:07d}",
+            "vorname": vorname,
+            "name": name,
+            "firma": firma,
+            "strasse": f"{self.pick(STRASSEN)} {self.number(1, 120)}",
+            "plz": plz,
+            "ort": ort,
+            "telefon_p": self.phone(VORWAHLEN) if rng.random() < 0.4 else "",
+            "telefon_g": self.phone(VORWAHLEN) if firma else "",
+            "natel": self.phone(NATEL_PREFIXES),
+            "email_p": f"{mail}{self.number(1, 99)}@{self.pick(EMAIL_DOMAINS)}",
+            "email_g": f"{mail}@{name.lower()}.ch" if firma else "",
+            "geburtsdatum": f"{self.number(1940, 2004)}-{self.number(1, 12):02d}-{self.number(1, 28):02d}",
+            "created_at": created_at,
+        }
+        customer["search_terms"] = customer_search_terms(customer)
+        return customer
+
+    def vehicle(self, customer: dict, created_at: datetime, users: list) -> dict:
+        rng = self.rng
+        marke = self.pick(MARKEN)
+        return {
+            "id": self.uuid(),
+            "customer_id": customer["id"],
+            "marke": marke,
+            "modell": self.pick(FAHRZEUGE[marke]),
+            "chassis_nr": "WVW" + "".join(rng.choices(VIN_CHARS, k=14)),
+            "stamm_nr": f"{self.number(100, 999)}.{self.number(100, 999)}.{self.number(100, 999)}",
+            "typenschein_nr": f"1{self.pick('ABCDEFGHKLMNPRSTUVWXYZ')}{self.pick('ABCDEFGHKLMNPRSTUVWXYZ')}{self.number(100, 999)}",
+            "farbe": self.pick(FARBEN),
+            "inverkehrsetzung": self.date(created_at - timedelta(days=3650), created_at),
+            "km_stand": str(self.number(0, 250) * 1000),
+            "vista_nr": str(self.number(100000, 999999)),
+            "verkaeufer": self.pick(users)["name"],
+            "kundenberater": self.pick(users)["name"],
+            "created_at": created_at,
+        }
+
+    def remark(self, customer: dict, created_at: datetime, users: list) -> dict:
+        return {
+            "id": self.uuid(),
+            "customer_id": customer["id"],
+            "text": self.pick(BEMERKUNGEN),
+            "timestamp": created_at.isoformat(),
+            "user": self.pick(users)["name"],
+            "created_at": created_at,
+        }
+
+    def correspondence(self, customer: dict, created_at: datetime, users: list) -> dict:
+        bemerkung = self.pick(KORRESPONDENZ)
+        return {
+            "id": self.uuid(),
+            "customer_id": customer["id"],
+            "bemerkung": bemerkung,
+            "datum": created_at.date().isoformat(),
+            "zeit": self.time(),
+            "textfeld": f"{bemerkung} an {customer['vorname']} {customer['name']} versendet",
+            "upload1": "",
+            "upload2": "",
+            "upload3": "",
+            "timestamp": created_at.isoformat(),
+            "user": self.pick(users)["name"],
+            "created_at": created_at,
+        }
+
+    def task(self, customer: dict, created_at: datetime, users: list) -> dict:
+        user = self.pick(users)
+        creator = self.pick(users)
+        return {
+            "id": self.uuid(),
+            "customer_id": customer["id"],
+            "customer_name": f"{customer['vorname']} {customer['name']}",
+            "datum_kontakt": self.date(created_at, created_at + timedelta(days=30)),
+            "zeitpunkt_kontakt": self.time(),
+            "bemerkungen": self.pick(BEMERKUNGEN),
+            "telefon_nummer": customer["natel"],
+            "assigned_to": user["id"],
+            "assigned_to_name": user["name"],
+            "status": "erledigt" if self.rng.random() < 0.7 else "offen",
+            "created_by": creator["id"],
+            "created_at": created_at,
+        }
+
+    def client_experience(self, customer: dict, created_at: datetime, users: list) -> dict:
+        marke = self.pick(MARKEN)
+        closed = self.rng.random() < 0.6
+        return {
+            "id": self.uuid(),
+            "customer_id": customer["id"],
+            "customer_name": f"{customer['vorname']} {customer['name']}",
+            "marke": marke,
+            "modell": self.pick(FAHRZEUGE[marke]),
+            "datum": created_at.date().isoformat(),
+            "zeit": self.time(),
+            "kundenreklamation": self.pick(REKLAMATIONEN),
+            "datei_upload": "",
+            "aktionen": [{
+                "text": "Kunde kontaktiert, Lösung vereinbart",
+                "timestamp": (created_at + timedelta(days=2)).isoformat(),
+                "user": self.pick(users)["name"],
+            }] if closed else [],
+            "status": "erledigt" if closed else "offen",
+            "created_at": created_at,
+            "created_by": self.pick(users)["name"],
+        }
+
+    def kaufvertrag(self, customer: dict, created_at: datetime, users: list) -> dict:
+        rng = self.rng
+        marke = self.pick(MARKEN)
+        eintausch = rng.random() < 0.3
+        eintausch_marke = self.pick(MARKEN)
+        return {
+            "id": self.uuid(),
+            "kunde_name": customer["name"],
+            "kunde_vorname": customer["vorname"],
+            "kunde_plz": customer["plz"],
+            "kunde_ort": customer["ort"],
+            "kunde_telefon": customer["natel"],
+            "kunde_email": customer["email_p"],
+            "fahrzeug_marke": marke,
+            "fahrzeug_modell": self.pick(FAHRZEUGE[marke]),
+            "fahrzeug_chassis_nr": "WVW" + "".join(rng.choices(VIN_CHARS, k=14)),
+            "fahrzeug_stamm_nr": f"{self.number(100, 999)}.{self.number(100, 999)}.{self.number(100, 999)}",
+            "fahrzeug_farbe": self.pick(FARBEN),
+            "fahrzeug_inverkehrsetzung": created_at.date().isoformat(),
+            "fahrzeug_typ": self.pick(FAHRZEUG_TYPEN),
+            "verkaufspreis": str(self.number(15, 90) * 1000 - 100),
+            "eintausch_marke": eintausch_marke if eintausch else "",
+            "eintausch_modell": self.pick(FAHRZEUGE[eintausch_marke]) if eintausch else "",
+            "eintausch_chassis_nr": "",
+            "eintausch_stamm_nr": "",
+            "eintausch_farbe": self.pick(FARBEN) if eintausch else "",
+            "eintausch_inverkehrsetzung": "",
+            "eintausch_km_stand": str(self.number(30, 200) * 1000) if eintausch else "",
+            "eintausch_preis": str(self.number(2, 20) * 1000) if eintausch else "",
+            "eintausch_bemerkungen": "",
+            "eintausch_upload_ausweis": "",
+            "eintausch_upload_aussen": "",
+            "eintausch_upload_innen": "",
+            "eintausch_uploads": [],
+            "created_at": created_at,
+            "created_by": self.pick(users)["name"],
+        }
+
+async def insert_writer(db, queue: asyncio.Queue, counts: dict):
+    while True:
+        item = await queue.get()
+        if item is None:
+            break
+        collection_name, docs = item
+        await db[collection_name].insert_many(docs, ordered=False)
+        counts[collection_name] = counts.get(collection_name, 0) + len(docs)
+
+async def generate(db, customers: int, users: int = 10, vehicles: float = 3.0, remarks: float = 2.0,
+                   correspondence: float = 0.5, tasks: float = 0.3, complaints: float = 0.05, contracts: float = 0.2,
+                   seed: int = 42, batch_size: int = 1000, writers: int = 8, extra_users: list = ()) -> dict:
+    generator = DataGenerator(seed)
+    # One hash for every generated account, bcrypt is far too slow to run per user
+    sales_users = generator.users(users, pwd_context.hash(GENERATED_PASSWORD))
+    assignees = sales_users + list(extra_users)
+    if not assignees:
+        raise ValueError("At least one user is needed to assign tasks to")
+    counts = {}
+    if sales_users:
+        await db.users.bulk_write(
+            [UpdateOne({"username": user["username"]}, {"$setOnInsert": user}, upsert=True) for user in sales_users],
+            ordered=False
+        )
+        counts["users"] = len(sales_users)
+
+    children = [
+        ("vehicles", vehicles, generator.vehicle),
+        ("remarks", remarks, generator.remark),
+        ("correspondence", correspondence, generator.correspondence),
+        ("tasks", tasks, generator.task),
+        ("client_experiences", complaints, generator.client_experience),
+        ("kaufvertraege", contracts, generator.kaufvertrag),
+    ]
+    queue = asyncio.Queue(maxsize=writers * 2)
+    pending = {name: [] for name in ["customers"] + [name for name, _, _ in children]}
+    customer_ids = []
+    start = DATA_END - timedelta(days=DATA_YEARS * 365)
+    step = (DATA_END - start) / max(customers, 1)
+
+    try:
+        # A failing writer cancels the producer, even while it waits on a full queue
+        async with asyncio.TaskGroup() as group:
+            for _ in range(writers):
+                group.create_task(insert_writer(db, queue, counts))
+            for index in range(customers):
+                created_at = start + step * index
+                customer = generator.customer(index, created_at)
+                customer_ids.append(customer["id"])
+                pending["customers"].append(customer)
+                for name, average, build in children:
+                    for _ in range(generator.count(average)):
+                        child_created = created_at + timedelta(seconds=generator.rng.uniform(0, (DATA_END - created_at).total_seconds()))
+                        pending[name].append(build(customer, child_created, assignees))
+                for name, docs in pending.items():
+                    if len(docs) >= batch_size:
+                        await queue.put((name, docs))
+                        pending[name] = []
+            for name, docs in pending.items():
+                if docs:
+                    await queue.put((name, docs))
+            for _ in range(writers):
+                await queue.put(None)
+    except ExceptionGroup as e:
+        raise e.exceptions[0]
+
+    # Data written outside the API must still invalidate conditional GETs
+    await db.collection_versions.bulk_write(
+        [UpdateOne({"_id": name}, {"$inc": {"version": 1}}, upsert=True) for name in counts],
+        ordered=False
+    )
+    return {"counts": counts, "customer_ids": customer_ids}
+
+async def ensure_indexes(db):
+    for collection_name, indexes in INDEXES.items():
+        for keys, options in indexes:
+            await db[collection_name].create_index(keys, name=index_name(keys), **options)
+
+async def generate_data():
+    args = parse_args()
+    mongo_url = os.environ['MONGO_URL']
+
+    client = AsyncIOMotorClient(mongo_url, tz_aware=True)
+    db = client[args.db]
+
+    if args.drop:
+        print(f"Dropping generated collections in {args.db}...")
+        for collection_name in GENERATED_COLLECTIONS:
+            await db.drop_collection(collection_name)
+
+    print(f"Generating {args.customers} customers into {args.db} (seed {args.seed})...")
+    started = time.perf_counter()
+    try:
+        result = await generate(
+            db, args.customers, users=args.users, vehicles=args.vehicles, remarks=args.remarks,
+            correspondence=args.correspondence, tasks=args.tasks, complaints=args.complaints, contracts=args.contracts,
+            seed=args.seed, batch_size=args.batch_size, writers=args.writers,
+        )
+    except BulkWriteError as e:
+        client.close()
+        # Ids are derived from the seed, so a second run into the same collections collides
+        sys.exit(f"Insert failed: {e.details['writeErrors'][0]['errmsg']}\nUse --drop or another --seed to generate again")
+    inserted = time.perf_counter() - started
+    for collection_name, count in sorted(result["counts"].items()):
+        print(f"  {collection_name}: {count}")
+    print(f"Inserted in {inserted:.1f}s")
+
+    # Building indexes once after the bulk load is faster than maintaining them per insert
+    print("Ensuring indexes...")
+    await ensure_indexes(db)
+    print(f"Done in {time.perf_counter() - started:.1f}s, generated users log in with password '{GENERATED_PASSWORD}'")
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(generate_data())
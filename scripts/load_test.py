@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Async load test and benchmark for the CRM API.
+
+Seeds a dedicated database, runs a weighted mix of realistic requests and
+reports throughput and p50/p95/p99 per endpoint.
+
+  # In-process through httpx's ASGI transport against the local mongod
+  python scripts/load_test.py --duration 30 --save baseline.json
+
+  # Without a mongod (needs mongomock-motor installed)
+  python scripts/load_test.py --stand-in
+
+  # Against a running uvicorn started with DB_NAME=<--db>
+  python scripts/load_test.py --url http://localhost:8001 --compare baseline.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from pathlib import Path
+from datetime import datetime, timezone
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from dotenv import load_dotenv
+
+# Load environment variables
+backend_dir = Path(__file__).parent.parent / 'backend'
+load_dotenv(backend_dir / '.env')
+
+import httpx
+
+LOADTEST_USER = "loadtest"
+LOADTEST_PASSWORD = "loadtest-password"
+
+# Relative weight of each scenario in the mixed workload
+SCENARIOS = {
+    "dashboard": 20,
+    "customer_list": 25,
+    "customer_search": 15,
+    "customer_detail": 25,
+    "csv_import": 2,
+    "login_burst": 3,
+}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server; default drives the app in-process")
+    parser.add_argument("--db", default=f"{os.environ.get('DB_NAME', 'crm')}_loadtest", help="Database to seed (dropped and recreated)")
+    parser.add_argument("--stand-in", action="store_true", help="Use mongomock-motor instead of a mongod (in-process only)")
+    parser.add_argument("--customers", type=int, default=5000)
+    # Averages per customer, as in generate_data.py
+    parser.add_argument("--vehicles", type=float, default=3.0)
+    parser.add_argument("--remarks", type=float, default=2.0)
+    parser.add_argument("--tasks", type=float, default=0.3)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds to run the mixed workload")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--import-rows", type=int, default=200, help="Rows per CSV import request")
+    parser.add_argument("--login-burst", type=int, default=10, help="Concurrent logins per burst")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", help="Write the results as JSON baseline")
+    parser.add_argument("--compare", help="Compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 regression before failing (0.2 = 20%%)")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded database")
+    return parser.parse_args()
+
+async def seed(server, db, args):
+    from generate_data import generate
+
+    print(f"Seeding {args.db}: {args.customers} customers...")
+    for name in await db.list_collection_names():
+        await db.drop_collection(name)
+    for handler in server.app.router.on_startup:
+        await handler()
+
+    password = await server.get_password_hash(LOADTEST_PASSWORD)
+    user = server.User(username=LOADTEST_USER, name="Load Test", role="admin").model_dump()
+    await db.users.insert_one({**user, "password": password})
+
+    result = await generate(
+        db, args.customers, users=0, vehicles=args.vehicles, remarks=args.remarks, tasks=args.tasks,
+        seed=args.seed, extra_users=[user],
+    )
+    return result["customer_ids"]
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+class Recorder:
+    def __init__(self):
+        self.samples = {}
+        self.errors = {}
+
+    async def timed(self, name, request):
+        start = time.perf_counter()
+        try:
+            response = await request
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        self.samples.setdefault(name, []).append(time.perf_counter() - start)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self, elapsed):
+        results = {}
+        for name, samples in sorted(self.samples.items()):
+            samples = sorted(samples)
+            results[name] = {
+                "requests": len(samples),
+                "errors": self.errors.get(name, 0),
+                "throughput_rps": len(samples) / elapsed,
+                "mean_ms": sum(samples) / len(samples) * 1000,
+                "p50_ms": percentile(samples, 0.50) * 1000,
+                "p95_ms": percentile(samples, 0.95) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+            }
+        return results
+
+async def login(http):
+    response = await http.post("/auth/login", json={"username": LOADTEST_USER, "password": LOADTEST_PASSWORD})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+def import_csv(rows, counter):
+    lines = ["kunden_nr,vorname,name,strasse,plz,ort,bemerkungen"]
+    for _ in range(rows):
+        counter[0] += 1
+        lines.append(f"LTI{counter[0]:08d},Import,Kunde {counter[0]},Weg 1,8000,Zürich,Importiert")
+    return "\n".join(lines).encode("utf-8")
+
+async def worker(http, recorder, customer_ids, args, deadline, counter):
+    names = list(SCENARIOS)
+    weights = [SCENARIOS[name] for name in names]
+    while time.perf_counter() < deadline:
+        scenario = random.choices(names, weights)[0]
+        if scenario == "dashboard":
+            await recorder.timed("GET /dashboard/stats", http.get("/dashboard/stats"))
+        elif scenario == "customer_list":
+            await recorder.timed("GET /customers?view=summary", http.get("/customers", params={"view": "summary"}))
+        elif scenario == "customer_search":
+            await recorder.timed("GET /customers/search", http.get("/customers/search", params={"q": random.choice(["müller", "zürich", "G0000", "garage"])}))
+        elif scenario == "customer_detail":
+            await recorder.timed("GET /customers/{id}/full", http.get(f"/customers/{random.choice(customer_ids)}/full"))
+        elif scenario == "csv_import":
+            files = {"file": ("import.csv", import_csv(args.import_rows, counter), "text/csv")}
+            await recorder.timed("POST /customers/upload-csv", http.post("/customers/upload-csv", files=files))
+        elif scenario == "login_burst":
+            credentials = {"username": LOADTEST_USER, "password": LOADTEST_PASSWORD}
+            await asyncio.gather(*[recorder.timed("POST /auth/login", http.post("/auth/login", json=credentials)) for _ in range(args.login_burst)])
+
+def print_report(results, elapsed):
+    total = sum(result["requests"] for result in results.values())
+    print(f"\n{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)\n")
+    print(f"{'endpoint':<30}{'reqs':>7}{'err':>5}{'rps':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for name, result in results.items():
+        print(f"{name:<30}{result['requests']:>7}{result['errors']:>5}{result['throughput_rps']:>8.1f}"
+              f"{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}")
+
+def compare(results, baseline, tolerance):
+    print(f"\nCompared with baseline from {baseline['created_at']}:")
+    regressions = []
+    for name, result in results.items():
+        before = baseline["endpoints"].get(name)
+        if not before or not before["p95_ms"]:
+            continue
+        change = result["p95_ms"] / before["p95_ms"] - 1
+        flag = "  REGRESSION" if change > tolerance else ""
+        print(f"  {name:<30} p95 {before['p95_ms']:>8.1f} -> {result['p95_ms']:>8.1f} ms ({change:+.0%}){flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+async def run_load_test(args):
+    random.seed(args.seed)
+    original_db_name = os.environ.get("DB_NAME")
+    if args.db == original_db_name:
+        sys.exit(f"Refusing to seed the configured database {args.db}, pick another --db")
+    if args.stand_in and args.url:
+        sys.exit("--stand-in only works in-process, a remote server cannot see it")
+    os.environ["DB_NAME"] = args.db
+
+    import server
+    if args.stand_in:
+        from mongomock_motor import AsyncMongoMockClient
+        server.client = AsyncMongoMockClient()
+        server.db = server.client[args.db]
+    db = server.db
+
+    customer_ids = await seed(server, db, args)
+    counter = [0]
+
+    if args.url:
+        http = httpx.AsyncClient(base_url=f"{args.url.rstrip('/')}/api", timeout=60)
+    else:
+        http = httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://loadtest/api", timeout=60)
+    try:
+        http.headers["Authorization"] = f"Bearer {await login(http)}"
+        recorder = Recorder()
+        print(f"Running mixed workload for {args.duration:.0f}s with {args.concurrency} workers...")
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*[worker(http, recorder, customer_ids, args, deadline, counter) for _ in range(args.concurrency)])
+        elapsed = time.perf_counter() - start
+    finally:
+        await http.aclose()
+
+    results = recorder.report(elapsed)
+    print_report(results, elapsed)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+    if args.save:
+        baseline = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "target": args.url or ("asgi+stand-in" if args.stand_in else "asgi"),
+            "config": {key: getattr(args, key) for key in ("customers", "vehicles", "remarks", "tasks", "seed", "duration", "concurrency", "import_rows", "login_burst")},
+            "endpoints": results,
+        }
+        with open(args.save, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+
+    if not args.keep:
+        await server.client.drop_database(args.db)
+    for handler in server.app.router.on_shutdown:
+        await handler()
+
+    if regressions:
+        sys.exit(f"p95 regressed by more than {args.tolerance:.0%} on: {', '.join(regressions)}")
+
+if __name__ == "__main__":
+    asyncio.run(run_load_test(parse_args()))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Apply the numbered migrations in scripts/migrations.
+
+Each migration module has a docstring and a STEPS list. A step names a
+collection, the query matching documents that still need the change, an
+optional projection and a transform(doc) returning a list of (collection,
+operation) pairs plus a list of problems; a ValueError skips the whole
+document. Documents are read in _id order and written with bulk_write; after
+every batch the position is checkpointed in the migrations collection, so
+an interrupted run resumes where it stopped. A migration with problems is
+recorded as incomplete and starts over on the next run, once the data has
+been fixed.
+
+  python scripts/migrate.py --list
+  python scripts/migrate.py --dry-run
+  python scripts/migrate.py
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import importlib.util
+from pathlib import Path
+from datetime import datetime, timezone
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from dotenv import load_dotenv
+
+# Load environment variables
+backend_dir = Path(__file__).parent.parent / 'backend'
+load_dotenv(backend_dir / '.env')
+
+MIGRATIONS_DIR = Path(__file__).parent / 'migrations'
+BATCH_SIZE = 1000
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--list", action="store_true", help="Show migrations and their status")
+    parser.add_argument("--dry-run", action="store_true", help="Compute all writes without applying or recording them")
+    parser.add_argument("--only", help="Run only the migration with this number or name")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    return parser.parse_args()
+
+def load_migrations():
+    migrations = []
+    for path in sorted(MIGRATIONS_DIR.glob("[0-9][0-9][0-9][0-9]_*.py")):
+        spec = importlib.util.spec_from_file_location(f"migrations.{path.stem}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        migrations.append((path.stem, module))
+    return migrations
+
+def describe(module) -> str:
+    return (module.__doc__ or "").strip().split("\n")[0]
+
+async def run_step(db, name: str, number: int, step: dict, resume_after, batch_size: int, dry_run: bool) -> tuple:
+    source = db[step["collection"]]
+    last_id = resume_after
+    processed = 0
+    written = 0
+    skipped = 0
+    touched = set()
+    started = time.perf_counter()
+
+    while True:
+        query = {"$and": [step["query"], {"_id": {"$gt": last_id}}]} if last_id is not None else step["query"]
+        docs = await source.find(query, step.get("projection")).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not docs:
+            break
+        last_id = docs[-1]["_id"]
+
+        writes = {}
+        batch_skipped = 0
+        for doc in docs:
+            try:
+                operations, problems = step["transform"](doc)
+            except ValueError as e:
+                operations, problems = [], [str(e)]
+            for target, operation in operations:
+                writes.setdefault(target, []).append(operation)
+            if problems:
+                batch_skipped += 1
+                print(f"    Skipping {step['collection']} {doc['_id']}: {'; '.join(problems)}")
+
+        if not dry_run:
+            # Copies into other collections land before the source documents change
+            for target in sorted(writes, key=lambda target: target == step["collection"]):
+                await db[target].bulk_write(writes[target], ordered=False)
+            await db.migrations.update_one(
+                {"_id": name},
+                {"$set": {"step": number, "last_id": last_id}, "$inc": {"processed": len(docs), "skipped": batch_skipped}}
+            )
+        touched.update(writes)
+        skipped += batch_skipped
+        processed += len(docs)
+        written += sum(len(operations) for operations in writes.values())
+        rate = processed / max(time.perf_counter() - started, 1e-9)
+        print(f"    {step['collection']}: {processed} documents, {written} writes, {skipped} skipped ({rate:.0f} docs/s)")
+
+    return touched, skipped
+
+async def apply_migration(db, name: str, module, batch_size: int, dry_run: bool) -> int:
+    # Returns the number of skipped documents; only a run without any is recorded as done
+    record = await db.migrations.find_one({"_id": name}) or {}
+    if record.get("status") == "running":
+        print(f"Resuming {name} at step {record['step'] + 1} after {record.get('processed', 0)} documents")
+    else:
+        if record.get("status") == "incomplete":
+            print(f"Retrying {name}, {record.get('skipped', 0)} documents were skipped last time")
+            record = {}
+        print(f"Applying {name}: {describe(module)}")
+    resume_step = record.get("step", 0)
+
+    if not dry_run:
+        checkpoint = {} if record else {"step": 0, "last_id": None, "processed": 0, "skipped": 0}
+        await db.migrations.update_one(
+            {"_id": name},
+            {"$set": {"status": "running", "description": describe(module), **checkpoint},
+             "$setOnInsert": {"started_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+
+    started = time.perf_counter()
+    touched = set()
+    skipped = 0
+    for number, step in enumerate(module.STEPS):
+        if number < resume_step:
+            continue
+        print(f"  Step {number + 1}/{len(module.STEPS)}: {step['collection']}")
+        resume_after = record.get("last_id") if number == resume_step else None
+        step_touched, step_skipped = await run_step(db, name, number, step, resume_after, batch_size, dry_run)
+        touched |= step_touched
+        skipped += step_skipped
+    duration = time.perf_counter() - started
+
+    if dry_run:
+        print(f"Dry run of {name} finished in {duration:.1f}s, nothing written, {skipped} documents would be skipped")
+        return skipped
+    # Data changed outside the API must still invalidate conditional GETs
+    if touched:
+        await db.collection_versions.bulk_write(
+            [UpdateOne({"_id": target}, {"$inc": {"version": 1}}, upsert=True) for target in touched],
+            ordered=False
+        )
+    # Includes documents skipped before an interruption
+    skipped = (await db.migrations.find_one({"_id": name})).get("skipped", 0)
+    status = "incomplete" if skipped else "done"
+    await db.migrations.update_one(
+        {"_id": name},
+        {"$set": {"status": status, "finished_at": datetime.now(timezone.utc), "duration_seconds": duration}}
+    )
+    if skipped:
+        print(f"{name} is incomplete: {skipped} documents were skipped, fix them and run again")
+    else:
+        print(f"Applied {name} in {duration:.1f}s")
+    return skipped
+
+async def migrate():
+    args = parse_args()
+    mongo_url = os.environ['MONGO_URL']
+    db_name = os.environ['DB_NAME']
+
+    client = AsyncIOMotorClient(mongo_url, tz_aware=True)
+    db = client[db_name]
+
+    migrations = load_migrations()
+    records = {record["_id"]: record async for record in db.migrations.find()}
+
+    if args.list:
+        for name, module in migrations:
+            record = records.get(name, {})
+            status = record.get("status", "pending")
+            if status == "running":
+                status += f" ({record.get('processed', 0)} documents done)"
+            elif status == "incomplete":
+                status += f" ({record.get('skipped', 0)} skipped)"
+            print(f"{name:<40} {status:<30} {describe(module)}")
+        client.close()
+        return
+
+    if args.only:
+        migrations = [(name, module) for name, module in migrations if name == args.only or name.split("_")[0] == args.only]
+        if not migrations:
+            sys.exit(f"No migration {args.only}")
+    pending = [(name, module) for name, module in migrations if records.get(name, {}).get("status") != "done"]
+    if not pending:
+        print("No pending migrations")
+
+    for name, module in pending:
+        # Later migrations may rely on this one, so stop at the first incomplete run
+        if await apply_migration(db, name, module, args.batch_size, args.dry_run):
+            client.close()
+            sys.exit(1)
+
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
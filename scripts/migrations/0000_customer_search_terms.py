@@ -0,0 +1,21 @@
+"""Store the normalized search_terms on customers created before the indexed search."""
+from pymongo import UpdateOne
+
+# Same rules as customer_search_terms in server.py when this migration was written
+SEARCH_FIELDS = ("name", "vorname", "kunden_nr", "firma")
+
+def search_terms(customer):
+    terms = set()
+    for field in SEARCH_FIELDS:
+        terms.update(token for token in (customer.get(field) or "").lower().split() if token)
+    return sorted(terms)
+
+def add_search_terms(customer):
+    return [("customers", UpdateOne({"_id": customer["_id"]}, {"$set": {"search_terms": search_terms(customer)}}))], []
+
+STEPS = [{
+    "collection": "customers",
+    "query": {"search_terms": {"$exists": False}},
+    "projection": {"_id": 1, **{field: 1 for field in SEARCH_FIELDS}},
+    "transform": add_search_terms,
+}]
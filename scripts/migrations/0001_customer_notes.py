@@ -0,0 +1,73 @@
+"""Move embedded bemerkungen/korrespondenz arrays into the remarks and correspondence collections."""
+import uuid
+from datetime import datetime
+from pymongo import ReplaceOne, UpdateOne
+
+# Stable ids make re-runs after a crash overwrite instead of duplicating entries
+NOTE_NAMESPACE = uuid.UUID("6f1c2a9e-3d4b-4e8f-9a7c-5b2d1e0f8a6c")
+
+def note_id(customer_id, kind, index):
+    return str(uuid.uuid5(NOTE_NAMESPACE, f"{customer_id}:{kind}:{index}"))
+
+def parse_timestamp(value, fallback):
+    # created_at is a native datetime, the API-facing timestamp stays a string
+    try:
+        return datetime.fromisoformat(value) if isinstance(value, str) else fallback
+    except ValueError:
+        return fallback
+
+def build_remarks(customer):
+    bemerkungen = customer.get('bemerkungen')
+    if isinstance(bemerkungen, str):
+        # Oldest format: a single free-text string on the customer
+        created_at = customer.get('created_at', '')
+        bemerkungen = [{
+            "text": bemerkungen,
+            "timestamp": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+            "user": "System (Migration)"
+        }] if bemerkungen else []
+    remarks = []
+    for index, remark in enumerate(bemerkungen or []):
+        remarks.append({
+            "id": note_id(customer['id'], "remark", index),
+            "customer_id": customer['id'],
+            "text": remark.get('text', ''),
+            "timestamp": remark.get('timestamp', ''),
+            "user": remark.get('user', ''),
+            "created_at": parse_timestamp(remark.get('timestamp'), customer.get('created_at')),
+        })
+    return remarks
+
+def build_correspondence(customer):
+    correspondence = []
+    for index, entry in enumerate(customer.get('korrespondenz') or []):
+        correspondence.append({
+            "id": note_id(customer['id'], "correspondence", index),
+            "customer_id": customer['id'],
+            "bemerkung": entry.get('bemerkung', ''),
+            "datum": entry.get('datum', ''),
+            "zeit": entry.get('zeit', ''),
+            "textfeld": entry.get('textfeld', ''),
+            "upload1": entry.get('upload1', ''),
+            "upload2": entry.get('upload2', ''),
+            "upload3": entry.get('upload3', ''),
+            "timestamp": entry.get('timestamp', ''),
+            "user": entry.get('user', ''),
+            "created_at": parse_timestamp(entry.get('timestamp'), customer.get('created_at')),
+        })
+    return correspondence
+
+def move_notes(customer):
+    operations = (
+        [("remarks", ReplaceOne({"id": r["id"]}, r, upsert=True)) for r in build_remarks(customer)]
+        + [("correspondence", ReplaceOne({"id": c["id"]}, c, upsert=True)) for c in build_correspondence(customer)]
+        + [("customers", UpdateOne({"_id": customer["_id"]}, {"$unset": {"bemerkungen": "", "korrespondenz": ""}}))]
+    )
+    return operations, []
+
+STEPS = [{
+    "collection": "customers",
+    "query": {"$or": [{"bemerkungen": {"$exists": True}}, {"korrespondenz": {"$exists": True}}]},
+    "projection": {"_id": 1, "id": 1, "created_at": 1, "bemerkungen": 1, "korrespondenz": 1},
+    "transform": move_notes,
+}]
@@ -0,0 +1,70 @@
+"""Convert string timestamps and calendar dates to native datetimes."""
+from datetime import datetime, timezone
+from pymongo import UpdateOne
+
+# Timestamp fields (ISO datetimes) and calendar date fields (YYYY-MM-DD) per collection
+TIMESTAMP_FIELDS = {
+    "users": ["created_at"],
+    "customers": ["created_at"],
+    "remarks": ["created_at"],
+    "correspondence": ["created_at"],
+    "vehicles": ["created_at"],
+    "employees": ["created_at"],
+    "tasks": ["created_at"],
+    "client_experiences": ["created_at"],
+    "kaufvertraege": ["created_at"],
+}
+DATE_FIELDS = {
+    "vehicles": ["inverkehrsetzung"],
+    "employees": ["eintritt_firma", "geburtstag"],
+    "tasks": ["datum_kontakt"],
+}
+
+def parse_timestamp(value):
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def parse_date(value):
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
+        try:
+            return datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    # Free text like "03/2019" stays as is, the API returns such values raw
+    return value
+
+def converter(collection_name):
+    timestamp_fields = TIMESTAMP_FIELDS.get(collection_name, [])
+    date_fields = DATE_FIELDS.get(collection_name, [])
+
+    def convert(doc):
+        # Fields convert independently: a bad value must not keep the others strings,
+        # string created_at values sort before datetimes and break keyset pagination
+        updates = {}
+        problems = []
+        for field in timestamp_fields:
+            if isinstance(doc.get(field), str):
+                try:
+                    updates[field] = parse_timestamp(doc[field])
+                except ValueError as e:
+                    problems.append(f"{field}: {e}")
+        for field in date_fields:
+            if isinstance(doc.get(field), str) and (value := parse_date(doc[field])) != doc[field]:
+                updates[field] = value
+        operations = [(collection_name, UpdateOne({"_id": doc["_id"]}, {"$set": updates}))] if updates else []
+        return operations, problems
+    return convert
+
+def step(collection_name):
+    fields = TIMESTAMP_FIELDS.get(collection_name, []) + DATE_FIELDS.get(collection_name, [])
+    return {
+        "collection": collection_name,
+        # Converted documents no longer match, so a re-run only sees the rest
+        "query": {"$or": [{field: {"$type": "string"}} for field in fields]},
+        "projection": {field: 1 for field in fields},
+        "transform": converter(collection_name),
+    }
+
+STEPS = [step(collection_name) for collection_name in TIMESTAMP_FIELDS]
@@ -0,0 +1,18 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+# server.py reads these at import time; the tests never reach a real mongod
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "crm_test")
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir / "backend"))
+sys.path.insert(0, str(root_dir / "scripts"))
+
+@pytest.fixture
+def db():
+    return AsyncMongoMockClient(tz_aware=True)["crm_test"]
@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+import httpx
+import jwt
+
+import server
+
+async def call(db, method, path, token, **kwargs):
+    await db.users.update_one({"id": "u1"}, {"$setOnInsert": {"username": "anna", "name": "Anna", "role": "user"}}, upsert=True)
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path, headers={"Authorization": f"Bearer {token}"} if token else {}, **kwargs)
+
+def test_ticket_is_short_lived_and_scoped(db, monkeypatch):
+    monkeypatch.setattr(server, "db", db)
+    response = asyncio.run(call(db, "POST", "/api/events/ticket", server.create_access_token({"sub": "u1"})))
+    assert response.status_code == 200
+    payload = jwt.decode(response.json()["ticket"], server.SECRET_KEY, algorithms=[server.ALGORITHM])
+    assert payload["sub"] == "u1"
+    assert payload["scope"] == server.EVENT_TICKET_SCOPE
+    assert payload["exp"] <= time.time() + server.EVENT_TICKET_EXPIRE_SECONDS
+
+def test_ticket_opens_only_the_event_stream(db, monkeypatch):
+    monkeypatch.setattr(server, "db", db)
+    ticket = server.create_access_token({"sub": "u1", "scope": server.EVENT_TICKET_SCOPE})
+    assert asyncio.run(call(db, "GET", "/api/tasks", ticket)).status_code == 401
+
+def test_event_stream_rejects_access_tokens(db, monkeypatch):
+    monkeypatch.setattr(server, "db", db)
+    token = server.create_access_token({"sub": "u1"})
+    assert asyncio.run(call(db, "GET", "/api/events", None, params={"ticket": token})).status_code == 401
+    assert asyncio.run(call(db, "GET", "/api/events", None, params={"token": token})).status_code == 422
+
+class FakeChangeStream:
+    def __init__(self, changes, error):
+        self.changes = changes
+        self.error = error
+        self.resume_token = {"_data": "opened"}
+
+    async def __aenter__(self):
+        if self.error and not self.changes:
+            raise self.error
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        for change in self.changes:
+            self.resume_token = change["_id"]
+            yield change
+        if self.error:
+            raise self.error
+        await asyncio.Event().wait()
+
+class FakeDatabase:
+    def __init__(self, streams):
+        self.streams = streams
+        self.resumed_after = []
+
+    def watch(self, pipeline, full_document, resume_after):
+        self.resumed_after.append(resume_after)
+        return self.streams.pop(0)
+
+def task_change(number):
+    task = {"id": f"t{number}", "customer_id": "c1", "customer_name": "Hans Muster", "datum_kontakt": "2025-01-01",
+            "zeitpunkt_kontakt": "10:00", "bemerkungen": "", "telefon_nummer": "", "assigned_to": "u1",
+            "assigned_to_name": "Anna", "created_by": "u1"}
+    return {"_id": {"_data": f"token{number}"}, "operationType": "insert", "ns": {"coll": "tasks"}, "fullDocument": task}
+
+def test_change_stream_resumes_after_connection_loss(monkeypatch):
+    fake_db = FakeDatabase([
+        FakeChangeStream([task_change(1)], server.ConnectionFailure("connection reset")),
+        FakeChangeStream([], server.ServerSelectionTimeoutError("no primary")),
+        FakeChangeStream([task_change(2)], None),
+    ])
+    monkeypatch.setattr(server, "db", fake_db)
+    monkeypatch.setattr(server, "EVENT_RETRY_DELAY", 0)
+
+    async def scenario():
+        queue = asyncio.Queue()
+        server.event_subscribers.add(queue)
+        watcher = asyncio.create_task(server.watch_changes())
+        try:
+            events = [await asyncio.wait_for(queue.get(), 1) for _ in range(2)]
+            return events, server.event_source["change_stream"]
+        finally:
+            watcher.cancel()
+            server.event_subscribers.discard(queue)
+
+    events, streaming = asyncio.run(scenario())
+    assert [event["data"]["id"] for event in events] == ["t1", "t2"]
+    assert fake_db.resumed_after == [None, {"_data": "token1"}, {"_data": "token1"}]
+    assert streaming
+    assert not server.event_source["change_stream"]
+
+def test_change_stream_without_replica_set_stops(monkeypatch):
+    fake_db = FakeDatabase([FakeChangeStream([], server.OperationFailure("$changeStream is only supported on replica sets"))])
+    monkeypatch.setattr(server, "db", fake_db)
+    asyncio.run(asyncio.wait_for(server.watch_changes(), 1))
+    assert fake_db.resumed_after == [None]
+    assert not server.event_source["change_stream"]
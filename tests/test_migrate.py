@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pymongo import ReplaceOne, UpdateOne
+
+import migrate
+
+def copy_item(doc):
+    return [
+        ("copies", ReplaceOne({"_id": doc["_id"]}, {"_id": doc["_id"], "n": doc["n"]}, upsert=True)),
+        ("items", UpdateOne({"_id": doc["_id"]}, {"$set": {"copied": True}})),
+    ], []
+
+def crash_at(n, transform):
+    def crashing(doc):
+        if doc["n"] == n:
+            raise RuntimeError("worker killed")
+        return transform(doc)
+    return crashing
+
+def make_migration(transform):
+    return SimpleNamespace(__doc__="Copy items.", STEPS=[{
+        "collection": "items",
+        "query": {"copied": {"$exists": False}},
+        "transform": transform,
+    }])
+
+async def seed_items(db, count):
+    await db.items.insert_many([{"_id": n, "n": n} for n in range(count)])
+
+def test_resumes_from_checkpoint_after_crash(db):
+    async def scenario():
+        await seed_items(db, 20)
+        with pytest.raises(RuntimeError):
+            await migrate.apply_migration(db, "0099_copy", make_migration(crash_at(12, copy_item)), 5, False)
+
+        record = await db.migrations.find_one({"_id": "0099_copy"})
+        assert record["status"] == "running"
+        assert (record["step"], record["last_id"], record["processed"]) == (0, 9, 10)
+        assert await db.copies.count_documents({}) == 10
+
+        seen = []
+        def recording(doc):
+            seen.append(doc["n"])
+            return copy_item(doc)
+        skipped = await migrate.apply_migration(db, "0099_copy", make_migration(recording), 5, False)
+
+        assert skipped == 0
+        assert seen == list(range(10, 20))
+        record = await db.migrations.find_one({"_id": "0099_copy"})
+        assert (record["status"], record["processed"]) == ("done", 20)
+        assert await db.copies.count_documents({}) == 20
+        versions = {doc["_id"]: doc["version"] async for doc in db.collection_versions.find()}
+        assert versions == {"copies": 1, "items": 1}
+    asyncio.run(scenario())
+
+def test_skipped_documents_keep_migration_incomplete(db):
+    def strict(doc):
+        if doc.get("broken"):
+            raise ValueError("broken document")
+        return copy_item(doc)
+
+    async def scenario():
+        await seed_items(db, 10)
+        await db.items.update_one({"_id": 3}, {"$set": {"broken": True}})
+        with pytest.raises(RuntimeError):
+            await migrate.apply_migration(db, "0099_copy", make_migration(crash_at(7, strict)), 5, False)
+        # Skips before the crash still count once the resumed run finishes
+        assert await migrate.apply_migration(db, "0099_copy", make_migration(strict), 5, False) == 1
+        record = await db.migrations.find_one({"_id": "0099_copy"})
+        assert (record["status"], record["skipped"]) == ("incomplete", 1)
+
+        await db.items.update_one({"_id": 3}, {"$unset": {"broken": ""}})
+        assert await migrate.apply_migration(db, "0099_copy", make_migration(strict), 5, False) == 0
+        record = await db.migrations.find_one({"_id": "0099_copy"})
+        assert (record["status"], record["skipped"]) == ("done", 0)
+        assert await db.copies.count_documents({}) == 10
+    asyncio.run(scenario())
+
+def test_customer_notes_resume_without_duplicates(db):
+    name, module = next((name, module) for name, module in migrate.load_migrations() if name == "0001_customer_notes")
+
+    async def scenario():
+        await db.customers.insert_many([{
+            "id": f"c{n}",
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "bemerkungen": [{"text": "Rückruf", "timestamp": "2024-02-01T00:00:00+00:00", "user": "anna"}],
+            "korrespondenz": [{"bemerkung": "Offerte", "upload1": "offerte.pdf"}],
+        } for n in range(6)])
+        # A crashed run wrote the copies of a batch but not the customer updates
+        customer = await db.customers.find_one({"id": "c0"})
+        for target, operation in module.move_notes(customer)[0]:
+            if target != "customers":
+                await db[target].bulk_write([operation])
+        await db.migrations.insert_one({"_id": name, "status": "running", "step": 0, "last_id": None, "processed": 0, "skipped": 0})
+
+        assert await migrate.apply_migration(db, name, module, 4, False) == 0
+        assert await db.remarks.count_documents({}) == 6
+        assert await db.correspondence.count_documents({}) == 6
+        assert await db.customers.count_documents({"bemerkungen": {"$exists": True}}) == 0
+    asyncio.run(scenario())
@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import HTTPException, Response
+
+import server
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+def make_customers():
+    # Imports insert whole batches with one timestamp, so most rows tie on created_at
+    customers = []
+    for n in range(9):
+        created_at = START if n < 7 else START + timedelta(minutes=n)
+        customers.append({"id": f"c{8 - n}", "kunden_nr": f"K{n}", "vorname": "Hans", "name": f"Muster{n}", "ort": "Zürich", "created_at": created_at})
+    return customers
+
+def expected_order(customers):
+    return [customer["id"] for customer in sorted(customers, key=lambda customer: (customer["created_at"], customer["id"]))]
+
+async def collect_pages(fetch):
+    ids, pages, after = [], 0, None
+    while True:
+        docs, after = await fetch(after)
+        ids.extend(doc["id"] for doc in docs)
+        pages += 1
+        if after is None:
+            return ids, pages
+
+def test_cursor_crosses_equal_created_at(db):
+    customers = make_customers()
+
+    async def fetch(after):
+        response = Response()
+        docs = await server.paginate(db.customers, {}, {"_id": 0}, 3, after, response)
+        return docs, response.headers.get(server.NEXT_CURSOR_HEADER)
+
+    async def scenario():
+        await db.customers.insert_many([dict(customer) for customer in customers])
+        return await collect_pages(fetch)
+
+    ids, pages = asyncio.run(scenario())
+    assert ids == expected_order(customers)
+    assert pages == 3
+
+def test_last_page_has_no_cursor(db):
+    async def scenario():
+        await db.customers.insert_many(make_customers())
+        response = Response()
+        docs = await server.paginate(db.customers, {}, {"_id": 0}, 9, None, response)
+        return docs, response
+    docs, response = asyncio.run(scenario())
+    assert len(docs) == 9
+    assert server.NEXT_CURSOR_HEADER not in response.headers
+
+def test_invalid_cursor_is_rejected(db):
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(server.paginate(db.customers, {}, {"_id": 0}, 3, "not-a-cursor", Response()))
+    assert excinfo.value.status_code == 400
+
+async def api_pages(db, path, params):
+    admin = {"username": "admin", "name": "Admin", "role": "admin", "created_at": START}
+    await db.users.update_one({"id": "admin"}, {"$setOnInsert": admin}, upsert=True)
+    token = server.create_access_token({"sub": "admin"})
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", headers={"Authorization": f"Bearer {token}"}) as client:
+        async def fetch(after):
+            response = await client.get(path, params={**params, **({"after": after} if after else {})})
+            assert response.status_code == 200
+            return response.json(), response.headers.get(server.NEXT_CURSOR_HEADER)
+        return await collect_pages(fetch)
+
+def test_list_endpoint_follows_next_cursor_header(db, monkeypatch):
+    monkeypatch.setattr(server, "db", db)
+    customers = make_customers()
+
+    async def scenario():
+        await db.customers.insert_many([dict(customer) for customer in customers])
+        return await api_pages(db, "/api/customers", {"view": "summary", "limit": 4})
+
+    ids, pages = asyncio.run(scenario())
+    assert ids == expected_order(customers)
+    assert pages == 3
+
+@pytest.mark.parametrize("sort", ["name", "-name"])
+def test_name_sort_pages_across_equal_names(db, monkeypatch, sort):
+    monkeypatch.setattr(server, "db", db)
+    customers = make_customers()
+    for customer, name in zip(customers, ["Meier", "Abt", "Meier", "Zeh", "Meier", "Abt", "Meier", "Bär", "Meier"]):
+        customer["name"] = name
+
+    async def scenario():
+        await db.customers.insert_many([dict(customer) for customer in customers])
+        return await api_pages(db, "/api/customers", {"view": "summary", "sort": sort, "limit": 2})
+
+    ids, pages = asyncio.run(scenario())
+    expected = [customer["id"] for customer in sorted(customers, key=lambda customer: (customer["name"], customer["id"]))]
+    assert ids == (expected if sort == "name" else expected[::-1])
+    assert pages == 5
+
+def test_vehicle_search_reaches_unloaded_pages(db, monkeypatch):
+    monkeypatch.setattr(server, "db", db)
+    vehicles = [{
+        "id": f"v{n:02d}",
+        "customer_id": "c1",
+        "marke": "BMW" if n % 4 else "Audi",
+        "modell": "X5",
+        "chassis_nr": f"WBA{n:05d}",
+        "created_at": START + timedelta(minutes=n),
+    } for n in range(20)]
+
+    async def scenario():
+        await db.vehicles.insert_many([dict(vehicle) for vehicle in vehicles])
+        by_brand = await api_pages(db, "/api/vehicles", {"view": "summary", "q": "audi", "limit": 2})
+        by_chassis = await api_pages(db, "/api/vehicles", {"view": "summary", "q": " wba00019 ", "limit": 2})
+        return by_brand, by_chassis
+
+    (brand_ids, brand_pages), (chassis_ids, _) = asyncio.run(scenario())
+    assert brand_ids == ["v00", "v04", "v08", "v12", "v16"]
+    assert brand_pages == 3
+    assert chassis_ids == ["v19"]
+
+def test_search_results_follow_next_cursor(db, monkeypatch):
+    monkeypatch.setattr(server, "db", db)
+    customers = make_customers()
+    for customer in customers:
+        customer.update(name="Meier" if customer["kunden_nr"] != "K4" else "Huber", strasse="Bahnhofstrasse 1", plz="8001")
+        customer["search_terms"] = server.customer_search_terms(customer)
+
+    async def scenario():
+        await db.customers.insert_many([dict(customer) for customer in customers])
+        return await api_pages(db, "/api/customers/search", {"q": "mei", "sort": "name", "limit": 3})
+
+    ids, pages = asyncio.run(scenario())
+    assert ids == sorted(customer["id"] for customer in customers if customer["name"] == "Meier")
+    assert pages == 3